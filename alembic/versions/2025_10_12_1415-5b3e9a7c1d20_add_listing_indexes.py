@@ -0,0 +1,88 @@
+"""add listing indexes
+
+Revision ID: 5b3e9a7c1d20
+Revises: 699cc73d87e0
+Create Date: 2025-10-12 14:15:42.118305
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b3e9a7c1d20"
+down_revision: Union[str, Sequence[str], None] = "699cc73d87e0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, filter column) for keyset listings ordered by newest first
+LISTING_INDEXES = (
+    ("ix_photos_owner_id_created_at_uuid", "photos", "owner_id"),
+    ("ix_comments_photo_uuid_created_at_uuid", "comments", "photo_uuid"),
+    ("ix_comments_user_id_created_at_uuid", "comments", "user_id"),
+    (
+        "ix_photo_transformed_original_uuid_created_at_uuid",
+        "photo_transformed",
+        "original_uuid",
+    ),
+)
+
+RANKED_TAGS_CTE = """
+    WITH ranked AS (
+        SELECT
+            uuid,
+            first_value(uuid) OVER (
+                PARTITION BY name ORDER BY created_at, uuid
+            ) AS keep_uuid
+        FROM tags
+    )
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # merge duplicated tags into the oldest one, so the unique index can be built
+    op.execute(RANKED_TAGS_CTE + """
+        INSERT INTO photo_tags (photo_uuid, tag_uuid)
+        SELECT pt.photo_uuid, r.keep_uuid
+        FROM photo_tags pt
+        JOIN ranked r ON r.uuid = pt.tag_uuid AND r.uuid <> r.keep_uuid
+        ON CONFLICT DO NOTHING
+        """)
+    op.execute(RANKED_TAGS_CTE + """
+        DELETE FROM tags t
+        USING ranked r
+        WHERE t.uuid = r.uuid AND r.uuid <> r.keep_uuid
+        """)
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, column in LISTING_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column, sa.text("created_at DESC"), sa.text("uuid DESC")],
+                postgresql_concurrently=True,
+            )
+        op.create_index(
+            op.f("ix_tags_name"),
+            "tags",
+            ["name"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_tags_name"),
+            table_name="tags",
+            postgresql_concurrently=True,
+        )
+        for name, table, _ in reversed(LISTING_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,52 @@
+"""add tag search indexes
+
+Revision ID: 8c41f0d2e6b7
+Revises: 5b3e9a7c1d20
+Create Date: 2025-10-14 11:02:17.540982
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c41f0d2e6b7"
+down_revision: Union[str, Sequence[str], None] = "5b3e9a7c1d20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_photo_tags_tag_uuid_photo_uuid",
+            "photo_tags",
+            ["tag_uuid", "photo_uuid"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_photos_created_at_uuid",
+            "photos",
+            [sa.text("created_at DESC"), sa.text("uuid DESC")],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_photos_created_at_uuid",
+            table_name="photos",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_photo_tags_tag_uuid_photo_uuid",
+            table_name="photo_tags",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,79 @@
+"""add full text search
+
+Revision ID: 3f7d2a9b4c51
+Revises: 8c41f0d2e6b7
+Create Date: 2025-10-15 16:37:51.204376
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f7d2a9b4c51"
+down_revision: Union[str, Sequence[str], None] = "8c41f0d2e6b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "photos",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('english', coalesce(description, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "comments",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('english', text)", persisted=True),
+            nullable=True,
+        ),
+    )
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_photos_search_vector",
+            "photos",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_comments_search_vector",
+            "comments",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_comments_search_vector",
+            table_name="comments",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_photos_search_vector",
+            table_name="photos",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("comments", "search_vector")
+    op.drop_column("photos", "search_vector")
@@ -0,0 +1,42 @@
+"""add tags name trigram index
+
+Revision ID: a7e25c03f9d8
+Revises: 3f7d2a9b4c51
+Create Date: 2025-10-16 09:14:52.118340
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7e25c03f9d8"
+down_revision: Union[str, Sequence[str], None] = "3f7d2a9b4c51"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tags_name_trgm",
+            "tags",
+            ["name"],
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tags_name_trgm",
+            table_name="tags",
+            postgresql_concurrently=True,
+        )
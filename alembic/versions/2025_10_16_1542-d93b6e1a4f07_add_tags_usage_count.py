@@ -0,0 +1,56 @@
+"""add tags usage count
+
+Revision ID: d93b6e1a4f07
+Revises: a7e25c03f9d8
+Create Date: 2025-10-16 15:42:08.903615
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d93b6e1a4f07"
+down_revision: Union[str, Sequence[str], None] = "a7e25c03f9d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "tags",
+        sa.Column("usage_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute("""
+        UPDATE tags
+        SET usage_count = usage.usage_count
+        FROM (
+            SELECT tag_uuid, count(*) AS usage_count
+            FROM photo_tags
+            GROUP BY tag_uuid
+        ) AS usage
+        WHERE tags.uuid = usage.tag_uuid
+        """)
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tags_usage_count_name",
+            "tags",
+            [sa.text("usage_count DESC"), "name"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tags_usage_count_name",
+            table_name="tags",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("tags", "usage_count")
@@ -0,0 +1,42 @@
+"""add photos comments count
+
+Revision ID: 6f0c8e2b5a13
+Revises: d93b6e1a4f07
+Create Date: 2025-10-17 10:26:44.271903
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6f0c8e2b5a13"
+down_revision: Union[str, Sequence[str], None] = "d93b6e1a4f07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "photos",
+        sa.Column("comments_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute("""
+        UPDATE photos
+        SET comments_count = counts.comments_count
+        FROM (
+            SELECT photo_uuid, count(*) AS comments_count
+            FROM comments
+            GROUP BY photo_uuid
+        ) AS counts
+        WHERE photos.uuid = counts.photo_uuid
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("photos", "comments_count")
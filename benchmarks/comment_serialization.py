@@ -0,0 +1,70 @@
+"""CPU cost of rendering a page of comments from ORM objects vs plain rows.
+
+    python -m benchmarks.comment_serialization --page-size 20
+
+The ORM path does what FastAPI does for a `response_model`: validates every
+object into `CommentDto` from attributes, dumps it to JSON-compatible data
+and encodes that. The row path is `RowsJSONResponse`, used by listings.
+"""
+
+import argparse
+import json
+import timeit
+from collections import namedtuple
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+
+from src.core.models import CommentOrm
+from src.responses import RowsJSONResponse
+from src.schemas import CommentDto
+
+comments_adapter = TypeAdapter(list[CommentDto])
+
+# exposes `_asdict()` like the `Row` objects selected by `comments_crud`
+CommentRow = namedtuple("CommentRow", CommentDto.model_fields)
+
+
+def render_orm(comments: list[CommentOrm]) -> bytes:
+    validated = comments_adapter.validate_python(comments, from_attributes=True)
+    content = comments_adapter.dump_python(validated, mode="json")
+    return json.dumps(content, separators=(",", ":")).encode()
+
+
+def report(label: str, timer: timeit.Timer, number: int) -> float:
+    best = min(timer.repeat(repeat=5, number=number)) / number
+    print(f"{label:>7}: {best * 1_000_000:8.1f} us per page")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--number", type=int, default=2_000)
+    args = parser.parse_args()
+
+    now = datetime.now(timezone.utc)
+    fields = [
+        {
+            "text": f"comment {i} " * 10,
+            "uuid": uuid4(),
+            "photo_uuid": uuid4(),
+            "user_id": i,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(args.page_size)
+    ]
+    comments = [CommentOrm(**values) for values in fields]
+    rows = [CommentRow(**values) for values in fields]
+    response = RowsJSONResponse(rows)
+
+    assert json.loads(render_orm(comments)) == json.loads(response.render(rows))
+    orm = report("orm", timeit.Timer(lambda: render_orm(comments)), args.number)
+    row = report("rows", timeit.Timer(lambda: response.render(rows)), args.number)
+    print(f"{'speedup':>7}: {orm / row:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
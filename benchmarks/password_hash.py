@@ -0,0 +1,73 @@
+"""Login throughput with Argon2 run on the event loop or in the process pool.
+
+    python -m benchmarks.password_hash --logins 64 --concurrency 16
+
+Reports verified logins per second and the longest event loop stall, which is
+how long any other request served by the same worker would have to wait.
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.core import settings
+from src.services import PasswordHashService
+
+PASSWORD = "correct horse battery staple"
+
+
+async def watch_loop(stop: asyncio.Event, interval: float = 0.001) -> float:
+    """Return the longest delay of a timer beyond its interval."""
+    worst = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - started - interval)
+    return worst
+
+
+async def run(logins: int, concurrency: int, use_process_pool: bool) -> None:
+    settings.password_hash.use_process_pool = use_process_pool
+    service = PasswordHashService()
+    hashed = service.hash(PASSWORD)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def login() -> None:
+        async with semaphore:
+            # stands for the user lookup, yielding to other requests
+            await asyncio.sleep(0)
+            assert await service.verify_async(PASSWORD, hashed)
+
+    # starts pool workers, they are not part of steady state
+    await asyncio.gather(*(login() for _ in range(concurrency)))
+
+    stop = asyncio.Event()
+    watcher = asyncio.create_task(watch_loop(stop))
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    stall = await watcher
+
+    mode = "process pool" if use_process_pool else "event loop"
+    print(
+        f"{mode:>12}: {logins / elapsed:8.1f} logins/s, "
+        f"longest loop stall {stall * 1000:8.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    try:
+        for use_process_pool in (False, True):
+            asyncio.run(run(args.logins, args.concurrency, use_process_pool))
+    finally:
+        PasswordHashService.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Per-request cost of decoding an access token, with and without its cache.
+
+    python -m benchmarks.token_decode --number 20000
+
+Presents the same token repeatedly, as a client does between refreshes. The
+uncached case clears the cache before every call, so each one verifies the
+signature, validates claims and builds `TokenData` again.
+"""
+
+import argparse
+import timeit
+
+from src.constants import ACCESS_TOKEN_TYPE
+from src.schemas import CurrentUser, UserRoles
+from src.services import TokenService
+
+
+def report(label: str, timer: timeit.Timer, number: int) -> float:
+    best = min(timer.repeat(repeat=5, number=number)) / number
+    print(f"{label:>8}: {best * 1_000_000:8.2f} us per request")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20_000)
+    args = parser.parse_args()
+
+    service = TokenService()
+    user = CurrentUser(
+        id=1,
+        email="user@example.com",
+        role=UserRoles.USER,
+        is_active=True,
+    )
+    token = service.create_access_token(user)
+
+    def decode_uncached() -> None:
+        TokenService._decoded_cache.clear()
+        service.decode_token(token=token, token_type=ACCESS_TOKEN_TYPE)
+
+    def decode_cached() -> None:
+        service.decode_token(token=token, token_type=ACCESS_TOKEN_TYPE)
+
+    uncached = report("uncached", timeit.Timer(decode_uncached), args.number)
+    cached = report("cached", timeit.Timer(decode_cached), args.number)
+    print(f"{'speedup':>8}: {uncached / cached:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,3 +2,9 @@ TOKEN_TYPE_FIELD: str = "token_type"
 
 ACCESS_TOKEN_TYPE: str = "access"
 REFRESH_TOKEN_TYPE: str = "refresh"
+
+NEXT_CURSOR_HEADER: str = "X-Next-Cursor"
+
+MAX_EMBEDDED_COMMENTS: int = 10
+
+FOREIGN_KEY_VIOLATION: str = "23503"
@@ -1,9 +1,22 @@
 __all__ = (
+    "TTLCache",
+    "cache_backend",
     "cloudinary_cli",
+    "ImageStorageBusyError",
+    "ImageStorageError",
+    "ImageStorageTimeoutError",
     "settings",
     "db_helper",
+    "metrics_registry",
 )
 
-from .cloudinary import cloudinary_cli
+from .cache import TTLCache, cache_backend
+from .cloudinary import (
+    ImageStorageBusyError,
+    ImageStorageError,
+    ImageStorageTimeoutError,
+    cloudinary_cli,
+)
 from .config import settings
 from .database import db_helper
+from .metrics import metrics_registry
@@ -0,0 +1,164 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+from .config import CacheConfig, settings
+from .metrics import Counter, Gauge, metrics_registry
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded in-process LRU mapping whose entries expire after `ttl` seconds.
+
+    Not thread-safe: meant to be used from the event loop only. When `name`
+    is given, hit/miss counters and the hit ratio are exported as metrics.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, name: str | None = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+        if name is not None:
+            self._register_metrics(name)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get(self, key: K) -> V | None:
+        """Return cached value, or None if it is missing or expired."""
+        item = self._data.get(key)
+        if item is None or item[0] <= time.monotonic():
+            if item is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return item[1]
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Store value, evicting the least recently used entries over `maxsize`."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        """Drop a single entry if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def _register_metrics(self, name: str) -> None:
+        metrics_registry.register(
+            Counter(
+                f"{name}_hits_total",
+                f"Lookups served from {name}.",
+                callback=lambda: self.hits,
+            )
+        )
+        metrics_registry.register(
+            Counter(
+                f"{name}_misses_total",
+                f"Lookups not found in {name}.",
+                callback=lambda: self.misses,
+            )
+        )
+        metrics_registry.register(
+            Gauge(
+                f"{name}_hit_ratio",
+                f"Share of lookups served from {name}.",
+                callback=lambda: self.hit_ratio,
+            )
+        )
+        metrics_registry.register(
+            Gauge(
+                f"{name}_size",
+                f"Number of entries in {name}.",
+                callback=lambda: len(self),
+            )
+        )
+
+
+class CacheBackend(ABC):
+    """Async byte-oriented key-value cache shared by application services."""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: int) -> None: ...
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None: ...
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release backend resources."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Per-process backend, entries are not shared between workers."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._cache: TTLCache[str, bytes] = TTLCache(maxsize=maxsize, ttl=0)
+
+    async def get(self, key: str) -> bytes | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        self._cache.set(key, value, ttl=ttl)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._cache.pop(key)
+
+    async def close(self) -> None:
+        self._cache.clear()
+
+
+class RedisCacheBackend(CacheBackend):
+    """Backend for Redis or any server speaking its protocol, shared by workers."""
+
+    def __init__(self, url: str) -> None:
+        try:
+            from redis.asyncio import Redis
+        except ImportError:
+            raise RuntimeError("Redis cache backend requires the `redis` package")
+
+        self._client = Redis.from_url(url)
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._client.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        await self._client.set(key, value, ex=ttl)
+
+    async def delete(self, *keys: str) -> None:
+        await self._client.delete(*keys)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+def create_cache_backend(config: CacheConfig) -> CacheBackend:
+    if config.backend == "redis":
+        return RedisCacheBackend(url=config.redis_url)
+    return MemoryCacheBackend(maxsize=config.maxsize)
+
+
+cache_backend = create_cache_backend(settings.cache)
@@ -1,14 +1,35 @@
 import asyncio
-from typing import Any, BinaryIO
+import contextlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, AsyncIterator, BinaryIO, Callable, TypeVar
 from uuid import UUID
 
 import cloudinary
 from cloudinary import CloudinaryImage
-from cloudinary.uploader import destroy, upload
+from cloudinary.uploader import destroy, upload, upload_large_part
+from cloudinary.utils import random_public_id
 
 from src.schemas import TransformRequest, UploadImageResult
 
 from .config import settings
+from .metrics import Counter, Gauge, Histogram, metrics_registry
+
+T = TypeVar("T")
+
+
+class ImageStorageError(Exception):
+    """Image storage cannot take the call right now, the image is untouched."""
+
+
+class ImageStorageBusyError(ImageStorageError):
+    """All executor slots, queue included, are taken."""
+
+
+class ImageStorageTimeoutError(ImageStorageError):
+    """The call did not finish within `call_timeout`."""
 
 
 class CloudinaryClient:
@@ -21,6 +42,10 @@ class CloudinaryClient:
         api_secret: str,
         secure: bool,
         asset_folder: str,
+        upload_chunk_size: int,
+        executor_workers: int,
+        executor_queue_size: int,
+        call_timeout: float,
     ) -> None:
         cloudinary.config(
             cloud_name=cloud_name,
@@ -29,6 +54,75 @@ class CloudinaryClient:
             secure=secure,
         )
         self.asset_folder = asset_folder
+        self.upload_chunk_size = upload_chunk_size
+
+        self.max_pending = executor_workers + executor_queue_size
+        self.call_timeout = call_timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=executor_workers,
+            thread_name_prefix="cloudinary",
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._in_flight = 0
+
+        self.rejected_calls = metrics_registry.register(
+            Counter(
+                "cloudinary_executor_rejected_total",
+                "Cloudinary calls rejected because the executor queue was full.",
+            )
+        )
+        self.timed_out_calls = metrics_registry.register(
+            Counter(
+                "cloudinary_executor_timeouts_total",
+                "Cloudinary calls that exceeded the call timeout.",
+            )
+        )
+        self.call_duration = metrics_registry.register(
+            Histogram(
+                "cloudinary_call_duration_seconds",
+                "Time spent on Cloudinary calls, including the executor queue.",
+                labelnames=("operation",),
+            )
+        )
+        self.failed_calls = metrics_registry.register(
+            Counter(
+                "cloudinary_call_errors_total",
+                "Cloudinary calls that raised an error.",
+                labelnames=("operation",),
+            )
+        )
+        metrics_registry.register(
+            Gauge(
+                "cloudinary_executor_queue_depth",
+                "Cloudinary calls waiting for a free executor thread.",
+                callback=lambda: self.queue_depth,
+            )
+        )
+        metrics_registry.register(
+            Gauge(
+                "cloudinary_executor_in_flight",
+                "Cloudinary calls currently running in the executor.",
+                callback=lambda: self.in_flight,
+            )
+        )
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return self._pending - self._in_flight
+
+    @property
+    def saturation(self) -> float:
+        """Share of the executor capacity, queue included, currently taken."""
+        return self._pending / self.max_pending
+
+    def shutdown(self) -> None:
+        """Stop executor threads, dropping calls which have not started yet."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
     async def upload_image(
         self,
@@ -37,15 +131,48 @@ class CloudinaryClient:
         user_id: int,
     ) -> UploadImageResult:
         """Upload image under public_id=photo_uuid and return upload result."""
-        options = {
-            "public_id": str(photo_uuid),
-            "asset_folder": f"{self.asset_folder}/user_{user_id}",
-            "use_asset_folder_as_public_id_prefix": False,
-            "unique_filename": False,
-            "resource_type": "image",
-            "overwrite": True,
-        }
-        result: dict[str, Any] = await asyncio.to_thread(upload, file=file, **options)
+        options = self._upload_options(photo_uuid, user_id)
+        result: dict[str, Any] = await self._run(upload, file=file, **options)
+        return UploadImageResult(**result)
+
+    async def upload_image_stream(
+        self,
+        photo_uuid: UUID,
+        chunks: AsyncIterator[bytes],
+        user_id: int,
+    ) -> UploadImageResult:
+        """Upload image as it arrives using Cloudinary chunked upload API.
+
+        At most one `upload_chunk_size` part is buffered at a time. The total
+        size is unknown until the stream ends, so intermediate parts are sent
+        with `-1` as the total in Content-Range. When the stream fails after
+        parts were sent, whatever Cloudinary kept of them is destroyed.
+        """
+        options = self._upload_options(photo_uuid, user_id)
+        upload_id = random_public_id()
+        buffer = bytearray()
+        offset = 0
+
+        try:
+            async for data in chunks:
+                buffer += data
+                # keep at least one byte back, so the last part is always sent below
+                while len(buffer) > self.upload_chunk_size:
+                    part = bytes(buffer[: self.upload_chunk_size])
+                    del buffer[: self.upload_chunk_size]
+                    await self._upload_part(upload_id, part, offset, None, options)
+                    offset += len(part)
+        except Exception:
+            if offset:
+                # best effort, the original error is what the caller has to see
+                with contextlib.suppress(Exception):
+                    await self.destroy_image(photo_uuid=photo_uuid)
+            raise
+
+        total = offset + len(buffer)
+        result = await self._upload_part(
+            upload_id, bytes(buffer), offset, total, options
+        )
         return UploadImageResult(**result)
 
     async def destroy_image(self, photo_uuid: UUID) -> None:
@@ -56,7 +183,92 @@ class CloudinaryClient:
             "type": "upload",
             "invalidate": True,
         }
-        await asyncio.to_thread(destroy, public_id=public_id, **options)
+        await self._run(destroy, public_id=public_id, **options)
+
+    def _upload_options(self, photo_uuid: UUID, user_id: int) -> dict[str, Any]:
+        """Return upload options placing the image under public_id=photo_uuid."""
+        return {
+            "public_id": str(photo_uuid),
+            "asset_folder": f"{self.asset_folder}/user_{user_id}",
+            "use_asset_folder_as_public_id_prefix": False,
+            "unique_filename": False,
+            "resource_type": "image",
+            "overwrite": True,
+        }
+
+    async def _upload_part(
+        self,
+        upload_id: str,
+        part: bytes,
+        offset: int,
+        total: int | None,
+        options: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Send a single part of a chunked upload."""
+        end = offset + len(part) - 1
+        http_headers = {
+            "Content-Range": f"bytes {offset}-{end}/{total or -1}",
+            "X-Unique-Upload-Id": upload_id,
+        }
+        return await self._run(
+            upload_large_part,
+            (options["public_id"], part),
+            http_headers=http_headers,
+            **options,
+        )
+
+    async def _run(self, func: Callable[..., T], /, *args, **kwargs) -> T:
+        """Run blocking SDK call in the dedicated executor.
+
+        Raises ImageStorageBusyError when `max_pending` calls are already
+        queued or running, and ImageStorageTimeoutError when the call does
+        not finish within `call_timeout`.
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected_calls.inc()
+                raise ImageStorageBusyError("Image storage is busy, try again later")
+            self._pending += 1
+
+        operation = func.__name__
+        started_at = time.perf_counter()
+        try:
+            future = self._executor.submit(self._call, partial(func, *args, **kwargs))
+        except BaseException:
+            # e.g. the executor was shut down, the slot would never be freed
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future),
+                timeout=self.call_timeout,
+            )
+        except TimeoutError:
+            self.timed_out_calls.inc()
+            raise ImageStorageTimeoutError("Image storage did not respond in time")
+        except Exception:
+            self.failed_calls.inc(operation=operation)
+            raise
+        finally:
+            self.call_duration.observe(
+                time.perf_counter() - started_at, operation=operation
+            )
+
+    def _call(self, func: Callable[[], T]) -> T:
+        """Executor-side wrapper tracking the number of running calls."""
+        with self._lock:
+            self._in_flight += 1
+        try:
+            return func()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _release(self, _) -> None:
+        """Free a queue slot once the call has finished or was cancelled."""
+        with self._lock:
+            self._pending -= 1
 
     def transform_image(
         self,
@@ -74,4 +286,8 @@ cloudinary_cli = CloudinaryClient(
     api_secret=settings.cloudinary.api_secret,
     secure=settings.cloudinary.secure,
     asset_folder=settings.cloudinary.asset_folder,
+    upload_chunk_size=settings.cloudinary.upload_chunk_size,
+    executor_workers=settings.cloudinary.executor_workers,
+    executor_queue_size=settings.cloudinary.executor_queue_size,
+    call_timeout=settings.cloudinary.call_timeout,
 )
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel, EmailStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -50,6 +52,19 @@ class CloudinaryConfig(BaseModel):
 
     asset_folder: str = "photo-share"
 
+    # chunked uploads: Cloudinary requires every part but the last to be >= 5MB
+    upload_chunk_size: int = 6 * 1024 * 1024
+    max_upload_size: int = 50 * 1024 * 1024
+
+    # dedicated thread pool for blocking SDK calls
+    executor_workers: int = 8
+    executor_queue_size: int = 32
+    call_timeout: float = 60.0
+
+    # batch uploads: files per request and uploads running at once per request
+    batch_max_files: int = 20
+    batch_upload_concurrency: int = 4
+
 
 class JwtConfig(BaseModel):
     """JWT configuration."""
@@ -60,6 +75,56 @@ class JwtConfig(BaseModel):
     access_token_expire_minutes: int = 15
     refresh_token_expire_days: int = 7
 
+    # number of validated tokens kept in memory until their expiration
+    decode_cache_size: int = 10_000
+
+
+class PasswordHashConfig(BaseModel):
+    """Password hashing configuration."""
+
+    use_process_pool: bool = True
+    # defaults to the number of CPUs
+    pool_size: int | None = None
+    # caps concurrent hashes, each Argon2 hash allocates 64MB
+    memory_budget_mb: int = 512
+
+
+class UserCacheConfig(BaseModel):
+    """Cache of authenticated users configuration."""
+
+    maxsize: int = 10_000
+    # bounds staleness on workers that did not handle the invalidating request
+    ttl: int = 60
+    # seconds a worker trusts its last lookup of revocations in the shared cache
+    revocation_ttl: int = 5
+
+
+class CacheConfig(BaseModel):
+    """Shared response cache configuration."""
+
+    # "memory" is per worker, "redis" is shared by all workers
+    backend: Literal["memory", "redis"] = "memory"
+    redis_url: str = "redis://localhost:6379/0"
+    maxsize: int = 10_000
+    ttl: int = 300
+
+
+class TagSuggestConfig(BaseModel):
+    """Tag autocomplete configuration."""
+
+    # seconds between rebuilds of the in-memory prefix index
+    refresh_interval: int = 60
+    # above this many tags suggestions are served by the trigram index instead
+    max_indexed_tags: int = 100_000
+
+
+class HealthConfig(BaseModel):
+    """Readiness probe configuration."""
+
+    db_timeout: float = 1.0
+    # seconds a probe result is reused, so probes do not load the database
+    cache_ttl: float = 2.0
+
 
 class FirstAdminConfig(BaseModel):
     """First admin configuration."""
@@ -80,6 +145,11 @@ class Settings(BaseSettings):
     db: DatabaseConfig
     cloudinary: CloudinaryConfig
     jwt: JwtConfig
+    password_hash: PasswordHashConfig = PasswordHashConfig()
+    user_cache: UserCacheConfig = UserCacheConfig()
+    cache: CacheConfig = CacheConfig()
+    tag_suggest: TagSuggestConfig = TagSuggestConfig()
+    health: HealthConfig = HealthConfig()
     first_admin: FirstAdminConfig
 
 
@@ -1,8 +1,11 @@
 from typing import AsyncGenerator
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from .config import settings
+from .db_stats import instrument_engine
+from .metrics import Gauge, metrics_registry
 
 
 class DatabaseHelper:
@@ -25,6 +28,9 @@ class DatabaseHelper:
             pool_pre_ping=pool_pre_ping,
             pool_recycle=pool_recycle,
         )
+        instrument_engine(self.engine.sync_engine)
+        self._register_pool_metrics()
+        self.pool_capacity = pool_size + max_overflow
         self.session_factory = async_sessionmaker(
             bind=self.engine,
             autoflush=False,
@@ -32,6 +38,47 @@ class DatabaseHelper:
             expire_on_commit=False,
         )
 
+    def _register_pool_metrics(self) -> None:
+        pool = self.engine.pool
+        metrics_registry.register(
+            Gauge(
+                "db_pool_size",
+                "Persistent connections the pool keeps open.",
+                callback=pool.size,
+            )
+        )
+        metrics_registry.register(
+            Gauge(
+                "db_pool_checked_out",
+                "Connections currently in use.",
+                callback=pool.checkedout,
+            )
+        )
+        metrics_registry.register(
+            Gauge(
+                "db_pool_checked_in",
+                "Idle connections available in the pool.",
+                callback=pool.checkedin,
+            )
+        )
+        metrics_registry.register(
+            Gauge(
+                "db_pool_overflow",
+                "Connections open beyond `pool_size`, negative while below it.",
+                callback=pool.overflow,
+            )
+        )
+
+    @property
+    def pool_saturation(self) -> float:
+        """Share of the pool capacity, overflow included, currently in use."""
+        return self.engine.pool.checkedout() / self.pool_capacity
+
+    async def ping(self) -> None:
+        """Run a trivial query, waiting for a free connection if needed."""
+        async with self.engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
     async def dispose(self) -> None:
         """Properly close all database connections."""
         await self.engine.dispose()
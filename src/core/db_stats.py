@@ -0,0 +1,51 @@
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import Engine, event
+
+from .metrics import Counter, metrics_registry
+
+db_queries_total = metrics_registry.register(
+    Counter("db_queries_total", "SQL statements executed.")
+)
+db_query_seconds_total = metrics_registry.register(
+    Counter("db_query_seconds_total", "Time spent executing SQL statements.")
+)
+
+
+@dataclass
+class RequestStats:
+    """Database usage accumulated while handling a single request."""
+
+    queries: int = 0
+    db_time: float = 0.0
+
+
+# set by `RequestStatsMiddleware`, statements outside of requests are not tracked
+request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats", default=None
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started_at"].pop()
+    db_queries_total.inc()
+    db_query_seconds_total.inc(elapsed)
+    if (stats := request_stats.get()) is not None:
+        stats.queries += 1
+        stats.db_time += elapsed
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Count statements and their execution time, globally and per request.
+
+    Async engines have to pass their `sync_engine`, the async driver runs
+    cursor events in the context of the awaiting task.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -2,6 +2,7 @@ __all__ = (
     "Base",
     "CommentOrm",
     "PhotoOrm",
+    "PhotoTagM2M",
     "PhotoTransformedOrm",
     "TagOrm",
     "UserOrm",
@@ -9,5 +10,5 @@ __all__ = (
 
 from .base import Base
 from .comments import CommentOrm
-from .photos import PhotoOrm, PhotoTransformedOrm, TagOrm
+from .photos import PhotoOrm, PhotoTagM2M, PhotoTransformedOrm, TagOrm
 from .users import UserOrm
@@ -1,7 +1,8 @@
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Text
+from sqlalchemy import Computed, ForeignKey, Index, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, uuid_pk
@@ -22,5 +23,29 @@ class CommentOrm(TimestampMixin, Base):
         ForeignKey("users.id", ondelete="RESTRICT"),
     )
     text: Mapped[str] = mapped_column(Text)
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('english', text)", persisted=True),
+        deferred=True,
+    )
 
     user: Mapped["UserOrm"] = relationship()
+
+
+Index(
+    "ix_comments_search_vector",
+    CommentOrm.search_vector,
+    postgresql_using="gin",
+)
+Index(
+    "ix_comments_photo_uuid_created_at_uuid",
+    CommentOrm.photo_uuid,
+    CommentOrm.created_at.desc(),
+    CommentOrm.uuid.desc(),
+)
+Index(
+    "ix_comments_user_id_created_at_uuid",
+    CommentOrm.user_id,
+    CommentOrm.created_at.desc(),
+    CommentOrm.uuid.desc(),
+)
@@ -1,7 +1,8 @@
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Text
+from sqlalchemy import Computed, ForeignKey, Index, Text, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, str_255, timestamp_tz, uuid_pk
@@ -20,6 +21,13 @@ class PhotoOrm(TimestampMixin, Base):
     )
     cloudinary_url: Mapped[str] = mapped_column(Text)
     description: Mapped[str_255 | None]
+    # maintained by `comments_service` alongside comment rows
+    comments_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('english', coalesce(description, ''))", persisted=True),
+        deferred=True,
+    )
 
     tags: Mapped[list["TagOrm"]] = relationship(
         back_populates="photos",
@@ -35,9 +43,21 @@ class PhotoOrm(TimestampMixin, Base):
 
 class TagOrm(Base):
     __tablename__ = "tags"
+    __table_args__ = (
+        # serves case-insensitive prefix lookups of tag suggestions
+        Index(
+            "ix_tags_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index("ix_tags_usage_count_name", text("usage_count DESC"), "name"),
+    )
 
     uuid: Mapped[uuid_pk]
-    name: Mapped[str]
+    name: Mapped[str] = mapped_column(unique=True, index=True)
+    # number of photos tagged, maintained by `photos_crud` alongside the links
+    usage_count: Mapped[int] = mapped_column(default=0, server_default="0")
     created_at: Mapped[timestamp_tz]
 
     photos: Mapped[list["PhotoOrm"]] = relationship(
@@ -48,6 +68,10 @@ class TagOrm(Base):
 
 class PhotoTagM2M(Base):
     __tablename__ = "photo_tags"
+    __table_args__ = (
+        # primary key leads with photo_uuid, lookups by tag need their own index
+        Index("ix_photo_tags_tag_uuid_photo_uuid", "tag_uuid", "photo_uuid"),
+    )
 
     photo_uuid: Mapped[uuid_pk] = mapped_column(
         ForeignKey("photos.uuid", ondelete="CASCADE"),
@@ -68,3 +92,27 @@ class PhotoTransformedOrm(Base):
     created_at: Mapped[timestamp_tz]
 
     photo: Mapped[PhotoOrm] = relationship(back_populates="transformations")
+
+
+Index(
+    "ix_photos_search_vector",
+    PhotoOrm.search_vector,
+    postgresql_using="gin",
+)
+Index(
+    "ix_photos_created_at_uuid",
+    PhotoOrm.created_at.desc(),
+    PhotoOrm.uuid.desc(),
+)
+Index(
+    "ix_photos_owner_id_created_at_uuid",
+    PhotoOrm.owner_id,
+    PhotoOrm.created_at.desc(),
+    PhotoOrm.uuid.desc(),
+)
+Index(
+    "ix_photo_transformed_original_uuid_created_at_uuid",
+    PhotoTransformedOrm.original_uuid,
+    PhotoTransformedOrm.created_at.desc(),
+    PhotoTransformedOrm.uuid.desc(),
+)
@@ -1,9 +1,18 @@
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
 
-from src.core import db_helper
+from src.core import (
+    ImageStorageBusyError,
+    ImageStorageTimeoutError,
+    cache_backend,
+    cloudinary_cli,
+    db_helper,
+)
+from src.middleware import RequestStatsMiddleware
+from src.services import PasswordHashService
 
 
 @asynccontextmanager
@@ -12,8 +21,33 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
     # shutdown
     await db_helper.dispose()
+    await cache_backend.close()
+    cloudinary_cli.shutdown()
+    PasswordHashService.shutdown()
+
+
+async def image_storage_busy_handler(
+    request: Request, exc: ImageStorageBusyError
+) -> JSONResponse:
+    return JSONResponse(
+        content={"detail": str(exc)},
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": "1"},
+    )
+
+
+async def image_storage_timeout_handler(
+    request: Request, exc: ImageStorageTimeoutError
+) -> JSONResponse:
+    return JSONResponse(
+        content={"detail": str(exc)},
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+    )
 
 
 def create_app() -> FastAPI:
     app = FastAPI(lifespan=lifespan)
+    app.add_middleware(RequestStatsMiddleware)
+    app.add_exception_handler(ImageStorageBusyError, image_storage_busy_handler)
+    app.add_exception_handler(ImageStorageTimeoutError, image_storage_timeout_handler)
     return app
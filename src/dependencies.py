@@ -1,21 +1,63 @@
 from typing import Annotated
 
-from fastapi import Depends, Query
+from fastapi import Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.constants import ACCESS_TOKEN_TYPE
 from src.core import db_helper
-from src.core.models import UserOrm
+from src.schemas import CurrentUser, Cursor, PhotoDto
 from src.services import TokenService, auth_service
 
+
+def cursor_from_query(cursor: Annotated[str | None, Query()] = None) -> Cursor | None:
+    """Dependency resolver: decodes the opaque `cursor` query param or raises 400."""
+    if cursor is None:
+        return None
+    try:
+        return Cursor.decode(cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def photo_fields_from_query(
+    fields: Annotated[
+        str | None,
+        Query(description="Comma-separated photo fields, e.g. `uuid,cloudinary_url`"),
+    ] = None,
+) -> frozenset[str] | None:
+    """Dependency resolver: parses the sparse fieldset of photos or raises 400."""
+    if fields is None:
+        return None
+    selected = frozenset(name.strip() for name in fields.split(",") if name.strip())
+    if unknown := selected - PhotoDto.model_fields.keys():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    return selected or None
+
+
 offset_param = Annotated[int, Query(ge=0)]
 limit_param = Annotated[int, Query(gt=0, le=20)]
+cursor_dependency = Annotated[Cursor | None, Depends(cursor_from_query)]
+photo_fields_dependency = Annotated[
+    frozenset[str] | None, Depends(photo_fields_from_query)
+]
 
 db_dependency = Annotated[AsyncSession, Depends(db_helper.session_getter)]
 
 token_service_dependency = Annotated[TokenService, Depends(TokenService)]
 
 user_dependency = Annotated[
-    UserOrm,
+    CurrentUser,
     Depends(auth_service.get_current_user(from_token_type=ACCESS_TOKEN_TYPE)),
 ]
+
+# claims-only user for read-only endpoints, see `auth_service.get_token_principal`
+principal_dependency = Annotated[
+    CurrentUser,
+    Depends(auth_service.get_token_principal(from_token_type=ACCESS_TOKEN_TYPE)),
+]
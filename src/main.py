@@ -1,9 +1,11 @@
 from fastapi import status
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, RedirectResponse
 
+from src.core import metrics_registry
 from src.create_app import create_app
 from src.routes import router as main_router
-from src.schemas import HealthResponse
+from src.schemas import HealthResponse, ReadinessResponse
+from src.services import health_service
 
 app = create_app()
 app.include_router(main_router)
@@ -24,3 +26,31 @@ async def check_health():
         status_code=status.HTTP_200_OK,
         headers={"Cache-Control": "no-cache"},
     )
+
+
+@app.get(
+    "/health/ready",
+    response_model=ReadinessResponse,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ReadinessResponse}},
+    tags=["meta"],
+)
+async def check_readiness():
+    readiness = await health_service.check_readiness()
+    return JSONResponse(
+        content=readiness.model_dump(),
+        status_code=(
+            status.HTTP_200_OK
+            if readiness.status == "ok"
+            else status.HTTP_503_SERVICE_UNAVAILABLE
+        ),
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@app.get("/metrics", response_class=PlainTextResponse, tags=["meta"])
+async def get_metrics():
+    return PlainTextResponse(
+        content=metrics_registry.render(),
+        media_type="text/plain; version=0.0.4",
+        headers={"Cache-Control": "no-cache"},
+    )
@@ -0,0 +1,84 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.db_stats import RequestStats, request_stats
+from src.core.metrics import Counter, Histogram, metrics_registry
+
+request_duration_seconds = metrics_registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "Time spent handling requests, by route and response status.",
+        labelnames=("method", "route", "status"),
+    )
+)
+request_db_queries_total = metrics_registry.register(
+    Counter(
+        "http_request_db_queries_total",
+        "SQL statements executed while handling requests, by route.",
+        labelnames=("method", "route"),
+    )
+)
+request_db_seconds_total = metrics_registry.register(
+    Counter(
+        "http_request_db_seconds_total",
+        "Time spent executing SQL statements while handling requests, by route.",
+        labelnames=("method", "route"),
+    )
+)
+
+
+def route_template(scope: Scope) -> str:
+    """Return path template of the matched route, keeping metric labels bounded."""
+    route = scope.get("route")
+    return getattr(route, "path", "unmatched")
+
+
+class RequestStatsMiddleware:
+    """Track latency and database usage of every request.
+
+    Statement count and database time are reported in the `Server-Timing`
+    response header. Both, along with the latency, are accumulated per route
+    in `/metrics`.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = request_stats.set(stats)
+        started_at = time.perf_counter()
+        # stays 500 when the app fails before responding
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                total = time.perf_counter() - started_at
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.db_time * 1000:.1f};desc="{stats.queries} queries", '
+                    f"total;dur={total * 1000:.1f}",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            request_stats.reset(token)
+            labels = {"method": scope["method"], "route": route_template(scope)}
+            request_duration_seconds.observe(
+                time.perf_counter() - started_at,
+                status=str(status_code),
+                **labels,
+            )
+            request_db_queries_total.inc(stats.queries, **labels)
+            request_db_seconds_total.inc(stats.db_time, **labels)
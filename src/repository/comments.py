@@ -1,10 +1,18 @@
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, func, select, true, tuple_, update
+from sqlalchemy.dialects.postgresql import websearch_to_tsquery
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm.attributes import set_committed_value
 
-from src.core.models import CommentOrm
-from src.schemas import CommentCreateDto, CommentUpdateDto
+from src.constants import FOREIGN_KEY_VIOLATION
+from src.core.models import CommentOrm, PhotoOrm, UserOrm
+from src.schemas import CommentCreateDto, CommentDto, CommentUpdateDto, Cursor
+
+# listings select plain rows shaped as CommentDto, see `RowsJSONResponse`
+comment_dto_columns = [getattr(CommentOrm, name) for name in CommentDto.model_fields]
 
 
 async def create_comment(
@@ -12,15 +20,25 @@ async def create_comment(
     photo_uuid: UUID,
     user_id: int,
     body: CommentCreateDto,
-) -> CommentOrm:
-    """Create and persist a comment record."""
+) -> CommentOrm | None:
+    """Create and persist a comment record.
+
+    Existence of the photo is enforced by the foreign key rather than checked
+    beforehand, so None is returned when the photo does not exist.
+    """
     comment = CommentOrm(
         photo_uuid=photo_uuid,
         user_id=user_id,
         text=body.text,
     )
     session.add(comment)
-    await session.commit()
+    try:
+        await session.commit()
+    except IntegrityError as exc:
+        await session.rollback()
+        if getattr(exc.orig, "sqlstate", None) == FOREIGN_KEY_VIOLATION:
+            return None
+        raise
     return comment
 
 
@@ -29,17 +47,72 @@ async def get_comments_by_photo(
     photo_uuid: UUID,
     offset: int = 0,
     limit: int = 10,
-) -> list[CommentOrm]:
-    """Return comments for a photo ordered by creation time."""
+    cursor: Cursor | None = None,
+) -> list[Row]:
+    """Return comments for a photo ordered by creation time, as CommentDto rows.
+
+    When `cursor` is given, only comments created after it are returned.
+    """
+    stmt = select(*comment_dto_columns).filter_by(photo_uuid=photo_uuid)
+    if cursor is not None:
+        stmt = stmt.where(
+            tuple_(CommentOrm.created_at, CommentOrm.uuid)
+            > tuple_(cursor.created_at, cursor.uuid)
+        )
+
     stmt = (
-        select(CommentOrm)
-        .filter_by(photo_uuid=photo_uuid)
-        .order_by(CommentOrm.created_at)
+        stmt.order_by(CommentOrm.created_at, CommentOrm.uuid)
         .offset(offset)
         .limit(limit)
     )
     result = await session.execute(stmt)
-    return list(result.scalars().all())
+    return list(result.all())
+
+
+async def get_latest_comments_by_photos(
+    session: AsyncSession,
+    photo_uuids: list[UUID],
+    limit: int,
+) -> dict[UUID, list[tuple[CommentOrm, str]]]:
+    """Return newest `limit` comments of every photo with emails of their authors.
+
+    A single query: a `LATERAL` subquery picks the newest comments of each
+    photo from `ix_comments_photo_uuid_created_at_uuid`.
+    """
+    latest_comments: dict[UUID, list[tuple[CommentOrm, str]]] = {
+        photo_uuid: [] for photo_uuid in photo_uuids
+    }
+    if not photo_uuids:
+        return latest_comments
+
+    photos = select(PhotoOrm.uuid).where(PhotoOrm.uuid.in_(photo_uuids)).subquery()
+    latest = (
+        select(
+            CommentOrm.uuid,
+            CommentOrm.photo_uuid,
+            CommentOrm.user_id,
+            CommentOrm.text,
+            CommentOrm.created_at,
+            CommentOrm.updated_at,
+        )
+        .where(CommentOrm.photo_uuid == photos.c.uuid)
+        .order_by(CommentOrm.created_at.desc(), CommentOrm.uuid.desc())
+        .limit(limit)
+        .lateral()
+    )
+    comment = aliased(CommentOrm, latest)
+    stmt = (
+        select(comment, UserOrm.email)
+        .select_from(photos)
+        .join(latest, true())
+        .join(UserOrm, UserOrm.id == comment.user_id)
+        .order_by(comment.photo_uuid, comment.created_at.desc(), comment.uuid.desc())
+    )
+
+    results = await session.execute(stmt)
+    for comment_orm, email in results.all():
+        latest_comments[comment_orm.photo_uuid].append((comment_orm, email))
+    return latest_comments
 
 
 async def get_comments(
@@ -47,17 +120,46 @@ async def get_comments(
     user_id: int,
     offset: int = 0,
     limit: int = 10,
-) -> list[CommentOrm]:
-    """Return user comments."""
+    cursor: Cursor | None = None,
+) -> list[Row]:
+    """Return user comments ordered by newest first, as CommentDto rows.
+
+    When `cursor` is given, only comments older than it are returned.
+    """
+    stmt = select(*comment_dto_columns).filter_by(user_id=user_id)
+    if cursor is not None:
+        stmt = stmt.where(
+            tuple_(CommentOrm.created_at, CommentOrm.uuid)
+            < tuple_(cursor.created_at, cursor.uuid)
+        )
+
     stmt = (
-        select(CommentOrm)
-        .filter_by(user_id=user_id)
-        .order_by(CommentOrm.created_at.desc())
+        stmt.order_by(CommentOrm.created_at.desc(), CommentOrm.uuid.desc())
         .offset(offset)
         .limit(limit)
     )
     result = await session.execute(stmt)
-    return list(result.scalars().all())
+    return list(result.all())
+
+
+async def search_comments_by_text(
+    session: AsyncSession,
+    query: str,
+    offset: int = 0,
+    limit: int = 10,
+) -> list[tuple[CommentOrm, float]]:
+    """Return comments whose text matches `query`, best matches first."""
+    ts_query = websearch_to_tsquery("english", query)
+    rank = func.ts_rank(CommentOrm.search_vector, ts_query)
+    stmt = (
+        select(CommentOrm, rank)
+        .where(CommentOrm.search_vector.bool_op("@@")(ts_query))
+        .order_by(rank.desc(), CommentOrm.created_at.desc())
+        .offset(offset)
+        .limit(limit)
+    )
+    result = await session.execute(stmt)
+    return [(comment, rank) for comment, rank in result.all()]
 
 
 async def get_comment_by_uuid(
@@ -80,11 +182,19 @@ async def update_comment(
     comment_orm: CommentOrm,
     body: CommentUpdateDto,
 ) -> CommentOrm:
-    """Update an existing comment."""
-    comment_orm.text = body.text
-
+    """Update an existing comment with a single `UPDATE ... RETURNING`."""
+    stmt = (
+        update(CommentOrm)
+        .where(CommentOrm.uuid == comment_orm.uuid)
+        .values(text=body.text)
+        .returning(CommentOrm.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    updated_at = await session.scalar(stmt)
     await session.commit()
-    await session.refresh(comment_orm)
+
+    set_committed_value(comment_orm, "text", body.text)
+    set_committed_value(comment_orm, "updated_at", updated_at)
     return comment_orm
 
 
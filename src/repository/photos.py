@@ -1,29 +1,67 @@
+from collections import Counter
+from collections.abc import Collection
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, exists, func, insert, select, tuple_, update
+from sqlalchemy.dialects.postgresql import websearch_to_tsquery
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from src.core.models import PhotoOrm, PhotoTransformedOrm, TagOrm
-from src.schemas import PhotoCreateDto, PhotoUpdateDto
+from src.core.models import PhotoOrm, PhotoTagM2M, PhotoTransformedOrm, TagOrm
+from src.schemas import Cursor, PhotoCreateDto, PhotoUpdateDto
 
+from . import tags as tags_crud
 
-async def create_photo(
+
+async def create_photos(
     session: AsyncSession,
-    body: PhotoCreateDto,
-    tags: list[TagOrm],
-) -> PhotoOrm:
-    """Create and persist a photo record."""
-    photo_orm = PhotoOrm(
-        uuid=body.uuid,
-        owner_id=body.owner_id,
-        cloudinary_url=body.cloudinary_url,
-        description=body.description,
-        tags=tags,
-    )
-    session.add(photo_orm)
+    bodies: list[PhotoCreateDto],
+    tags: list[list[TagOrm]],
+) -> list[PhotoOrm]:
+    """Bulk insert photos and their tag links in a single transaction.
+
+    `tags[i]` holds persisted tags of `bodies[i]`. Usage counts of the tags
+    are updated in the same transaction.
+    """
+    stmt = insert(PhotoOrm).returning(PhotoOrm, sort_by_parameter_order=True)
+    result = await session.scalars(stmt, [body.model_dump() for body in bodies])
+    photos = list(result.all())
+
+    links = [
+        {"photo_uuid": photo.uuid, "tag_uuid": tag.uuid}
+        for photo, photo_tags in zip(photos, tags, strict=True)
+        for tag in photo_tags
+    ]
+    if links:
+        await session.execute(insert(PhotoTagM2M), links)
+        usage = Counter(link["tag_uuid"] for link in links)
+        await tags_crud.add_usage(session=session, deltas=usage)
     await session.commit()
-    return photo_orm
+
+    # new photos: relationships are known, no need to load them back
+    for photo, photo_tags in zip(photos, tags, strict=True):
+        set_committed_value(photo, "tags", sorted(photo_tags, key=lambda t: t.name))
+        set_committed_value(photo, "transformations", [])
+    return photos
+
+
+def _fields_options(fields: Collection[str] | None) -> list:
+    """Return loader options fetching only `fields` of photos, or all of them."""
+    if fields is None:
+        return [
+            selectinload(PhotoOrm.tags),
+            selectinload(PhotoOrm.transformations),
+        ]
+
+    relationships = PhotoOrm.__mapper__.relationships
+    columns = [getattr(PhotoOrm, f) for f in fields if f not in relationships]
+    # created_at and uuid make the cursor of the next page
+    options = [load_only(PhotoOrm.created_at, *columns)]
+    options += [
+        selectinload(getattr(PhotoOrm, f)) for f in fields if f in relationships
+    ]
+    return options
 
 
 async def get_photos(
@@ -31,14 +69,59 @@ async def get_photos(
     owner_id: int,
     offset: int = 0,
     limit: int = 10,
+    cursor: Cursor | None = None,
+    fields: Collection[str] | None = None,
 ) -> list[PhotoOrm]:
-    """Return a page of photos ordered by newest first."""
+    """Return a page of photos ordered by newest first.
+
+    When `cursor` is given, rows strictly after it are returned (keyset
+    pagination), so the cost of a page does not depend on its depth.
+    `fields` limits loaded columns and relationships, everything by default.
+    """
+    stmt = select(PhotoOrm).filter_by(owner_id=owner_id)
+    if cursor is not None:
+        stmt = stmt.where(
+            tuple_(PhotoOrm.created_at, PhotoOrm.uuid)
+            < tuple_(cursor.created_at, cursor.uuid)
+        )
+
     stmt = (
-        select(PhotoOrm)
-        .filter_by(owner_id=owner_id)
-        .order_by(PhotoOrm.created_at.desc())
+        stmt.order_by(PhotoOrm.created_at.desc(), PhotoOrm.uuid.desc())
         .offset(offset)
         .limit(limit)
+        .options(*_fields_options(fields))
+    )
+    result = await session.execute(stmt)
+    return list(result.scalars().all())
+
+
+async def search_photos_by_tags(
+    session: AsyncSession,
+    names: list[str],
+    match_all: bool = False,
+    limit: int = 10,
+    cursor: Cursor | None = None,
+) -> list[PhotoOrm]:
+    """Return photos tagged with any (or all) of `names`, newest first."""
+    matched = (
+        select(PhotoTagM2M.photo_uuid)
+        .join(TagOrm, TagOrm.uuid == PhotoTagM2M.tag_uuid)
+        .where(TagOrm.name.in_(names))
+        .group_by(PhotoTagM2M.photo_uuid)
+    )
+    if match_all:
+        matched = matched.having(func.count() == len(names))
+
+    stmt = select(PhotoOrm).where(PhotoOrm.uuid.in_(matched))
+    if cursor is not None:
+        stmt = stmt.where(
+            tuple_(PhotoOrm.created_at, PhotoOrm.uuid)
+            < tuple_(cursor.created_at, cursor.uuid)
+        )
+
+    stmt = (
+        stmt.order_by(PhotoOrm.created_at.desc(), PhotoOrm.uuid.desc())
+        .limit(limit)
         .options(
             selectinload(PhotoOrm.tags),
             selectinload(PhotoOrm.transformations),
@@ -48,6 +131,88 @@ async def get_photos(
     return list(result.scalars().all())
 
 
+async def search_photos_by_text(
+    session: AsyncSession,
+    query: str,
+    offset: int = 0,
+    limit: int = 10,
+) -> list[tuple[PhotoOrm, float]]:
+    """Return photos whose description matches `query`, best matches first."""
+    ts_query = websearch_to_tsquery("english", query)
+    rank = func.ts_rank(PhotoOrm.search_vector, ts_query)
+    stmt = (
+        select(PhotoOrm, rank)
+        .where(PhotoOrm.search_vector.bool_op("@@")(ts_query))
+        .order_by(rank.desc(), PhotoOrm.created_at.desc())
+        .offset(offset)
+        .limit(limit)
+        .options(
+            selectinload(PhotoOrm.tags),
+            selectinload(PhotoOrm.transformations),
+        )
+    )
+    result = await session.execute(stmt)
+    return [(photo, rank) for photo, rank in result.all()]
+
+
+async def photo_exists(
+    session: AsyncSession,
+    photo_uuid: UUID,
+) -> bool:
+    """Check that a photo exists without loading it."""
+    stmt = select(exists().where(PhotoOrm.uuid == photo_uuid))
+    return bool(await session.scalar(stmt))
+
+
+async def add_comments_count(
+    session: AsyncSession,
+    photo_uuid: UUID,
+    delta: int,
+) -> int | None:
+    """Add `delta` to comment count of a photo without committing.
+
+    Returns owner id of the photo, or None if it does not exist. Leaves
+    `updated_at` untouched, comments are not edits of the photo.
+    """
+    stmt = (
+        update(PhotoOrm)
+        .where(PhotoOrm.uuid == photo_uuid)
+        .values(
+            comments_count=PhotoOrm.comments_count + delta,
+            updated_at=PhotoOrm.updated_at,
+        )
+        .returning(PhotoOrm.owner_id)
+        .execution_options(synchronize_session=False)
+    )
+    return await session.scalar(stmt)
+
+
+async def get_photo_version(
+    session: AsyncSession,
+    photo_uuid: UUID,
+    owner_id: int | None = None,
+) -> Row | None:
+    """Fetch what identifies the current version of a photo without loading it.
+
+    The row holds `updated_at`, `comments_count` and `transformations_count`.
+    """
+    transformations_count = (
+        select(func.count())
+        .where(PhotoTransformedOrm.original_uuid == PhotoOrm.uuid)
+        .scalar_subquery()
+    )
+    stmt = select(
+        PhotoOrm.updated_at,
+        PhotoOrm.comments_count,
+        transformations_count.label("transformations_count"),
+    ).where(PhotoOrm.uuid == photo_uuid)
+    if owner_id:
+        stmt = stmt.where(PhotoOrm.owner_id == owner_id)
+
+    result = await session.execute(stmt)
+    return result.first()
+
+
 async def get_photo_by_uuid(
     session: AsyncSession,
     photo_uuid: UUID,
@@ -72,11 +237,23 @@ async def update_photo(
     photo_orm: PhotoOrm,
     body: PhotoUpdateDto,
 ) -> PhotoOrm:
-    """Apply a partial update to an existing photo."""
-    photo_orm.description = body.description
+    """Apply a partial update to an existing photo.
 
+    A single `UPDATE ... RETURNING` fetches the server-side `updated_at`, so
+    the photo keeps its loaded relationships and is not reloaded.
+    """
+    stmt = (
+        update(PhotoOrm)
+        .where(PhotoOrm.uuid == photo_orm.uuid)
+        .values(description=body.description)
+        .returning(PhotoOrm.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    updated_at = await session.scalar(stmt)
     await session.commit()
-    await session.refresh(photo_orm)
+
+    set_committed_value(photo_orm, "description", body.description)
+    set_committed_value(photo_orm, "updated_at", updated_at)
     return photo_orm
 
 
@@ -84,7 +261,14 @@ async def delete_photo(
     session: AsyncSession,
     photo_orm: PhotoOrm,
 ) -> None:
-    """Delete a photo."""
+    """Delete a photo, releasing usage of its tags.
+
+    Expects `photo_orm.tags` to be loaded, see `get_photo_by_uuid`.
+    """
+    await tags_crud.add_usage(
+        session=session,
+        deltas={tag.uuid: -1 for tag in photo_orm.tags},
+    )
     await session.delete(photo_orm)
     await session.commit()
 
@@ -1,4 +1,8 @@
-from sqlalchemy import select
+from collections.abc import Mapping
+from uuid import UUID
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.models import TagOrm
@@ -13,3 +17,105 @@ async def get_tags_by_names(
 
     results = await session.execute(stmt)
     return list(results.scalars().all())
+
+
+async def has_more_tags_than(session: AsyncSession, count: int) -> bool:
+    """Check whether there are more than `count` tags, without counting them all."""
+    stmt = select(select(TagOrm.uuid).offset(count).exists())
+    return bool(await session.scalar(stmt))
+
+
+async def get_tags_usage(
+    session: AsyncSession,
+    limit: int | None = None,
+) -> list[tuple[str, int]]:
+    """Fetch names of tags with the number of photos using each of them."""
+    stmt = select(TagOrm.name, TagOrm.usage_count).limit(limit)
+
+    results = await session.execute(stmt)
+    return [(name, usage_count) for name, usage_count in results.all()]
+
+
+async def get_popular_tags(
+    session: AsyncSession,
+    limit: int = 10,
+) -> list[TagOrm]:
+    """Fetch most used tags, read from the `ix_tags_usage_count_name` index."""
+    stmt = select(TagOrm).order_by(TagOrm.usage_count.desc(), TagOrm.name).limit(limit)
+
+    results = await session.execute(stmt)
+    return list(results.scalars().all())
+
+
+async def suggest_tags(
+    session: AsyncSession,
+    prefix: str,
+    limit: int = 10,
+) -> list[tuple[str, int]]:
+    """Fetch most used tags starting with `prefix`, ignoring case.
+
+    `ILIKE` on the name is served by the trigram index `ix_tags_name_trgm`.
+    """
+    pattern = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    stmt = (
+        select(TagOrm.name, TagOrm.usage_count)
+        .where(TagOrm.name.ilike(f"{pattern}%", escape="\\"))
+        .order_by(TagOrm.usage_count.desc(), TagOrm.name)
+        .limit(limit)
+    )
+
+    results = await session.execute(stmt)
+    return [(name, usage_count) for name, usage_count in results.all()]
+
+
+async def add_usage(
+    session: AsyncSession,
+    deltas: Mapping[UUID, int],
+) -> None:
+    """Add `deltas[tag_uuid]` to usage counts of tags without committing.
+
+    Rows are updated in UUID order, so concurrent transactions lock them in
+    the same order and cannot deadlock on each other.
+    """
+    if not deltas:
+        return
+
+    tags = TagOrm.__table__
+    stmt = (
+        update(tags)
+        .where(tags.c.uuid == bindparam("tag_uuid"))
+        .values(usage_count=tags.c.usage_count + bindparam("delta"))
+    )
+    await session.execute(
+        stmt,
+        [{"tag_uuid": uuid, "delta": deltas[uuid]} for uuid in sorted(deltas)],
+    )
+
+
+async def upsert_tags(
+    session: AsyncSession,
+    names: list[str],
+) -> list[TagOrm]:
+    """Return tags with the given names, creating the missing ones.
+
+    New tags are inserted with a single `INSERT ... ON CONFLICT DO NOTHING`
+    backed by the unique index on `tags.name`, so concurrent requests cannot
+    create duplicates. Tags that already existed are fetched afterwards.
+    """
+    if not names:
+        return []
+
+    stmt = (
+        insert(TagOrm)
+        .values([{"name": name} for name in names])
+        .on_conflict_do_nothing(index_elements=[TagOrm.name])
+        .returning(TagOrm)
+    )
+    result = await session.scalars(stmt)
+    tags = list(result.all())
+
+    if len(tags) < len(names):
+        created = {t.name for t in tags}
+        existing = [name for name in names if name not in created]
+        tags += await get_tags_by_names(session=session, names=existing)
+    return tags
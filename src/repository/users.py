@@ -2,7 +2,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.models import UserOrm
-from src.schemas import UserCreateDto
+from src.schemas import UserAdminUpdateDto, UserCreateDto
 
 
 async def create_user(
@@ -22,7 +22,7 @@ async def create_user(
 async def get_user_by_id(
     session: AsyncSession,
     user_id: int,
-) -> UserOrm:
+) -> UserOrm | None:
     """Get a user by id."""
     stmt = select(UserOrm).filter_by(id=user_id)
 
@@ -39,3 +39,17 @@ async def get_user_by_email(
 
     result = await session.execute(stmt)
     return result.scalars().first()
+
+
+async def update_user(
+    session: AsyncSession,
+    user_orm: UserOrm,
+    body: UserAdminUpdateDto,
+) -> UserOrm:
+    """Apply a partial update of role and activity status."""
+    for field, value in body.model_dump(exclude_none=True).items():
+        setattr(user_orm, field, value)
+
+    await session.commit()
+    await session.refresh(user_orm)
+    return user_orm
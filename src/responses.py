@@ -0,0 +1,68 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Sequence
+
+from pydantic import TypeAdapter
+from sqlalchemy import Row
+from starlette.requests import Request
+from starlette.responses import Response
+
+rows_adapter = TypeAdapter(list[dict[str, Any]])
+
+
+class RowsJSONResponse(Response):
+    """JSON response rendering plain database rows as they are.
+
+    Skips validation of the declared response model, so rows have to hold
+    exactly its fields, in its order.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Sequence[Row]) -> bytes:
+        return rows_adapter.dump_json([row._asdict() for row in content])
+
+
+def make_etag(*parts: Any) -> str:
+    """Return strong entity tag identifying a version made of `parts`."""
+    digest = hashlib.blake2b(":".join(map(str, parts)).encode(), digest_size=16)
+    return f'"{digest.hexdigest()}"'
+
+
+def validator_headers(etag: str, last_modified: datetime | None) -> dict[str, str]:
+    """Return headers letting clients revalidate a private resource.
+
+    `last_modified` is left out for resources whose every change can't be
+    dated, they are revalidated by entity tag only.
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            last_modified.astimezone(timezone.utc), usegmt=True
+        )
+    return headers
+
+
+def is_not_modified(
+    request: Request,
+    etag: str,
+    last_modified: datetime | None,
+) -> bool:
+    """Evaluate `If-None-Match`, or `If-Modified-Since` in its absence."""
+    if (if_none_match := request.headers.get("if-none-match")) is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag in tags or "*" in tags
+
+    if last_modified is None:
+        return False
+    if (if_modified_since := request.headers.get("if-modified-since")) is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP dates have a one-second resolution
+        return last_modified.replace(microsecond=0) <= since
+    return False
@@ -4,6 +4,8 @@ from .admin import router as admin_router
 from .auth import router as auth_router
 from .comments import router as comments_router
 from .photos import router as photos_router
+from .search import router as search_router
+from .tags import router as tags_router
 from .users import router as users_router
 
 router = APIRouter(prefix="/api")
@@ -12,4 +14,6 @@ router.include_router(auth_router)
 router.include_router(users_router)
 router.include_router(photos_router)
 router.include_router(comments_router)
+router.include_router(search_router)
+router.include_router(tags_router)
 router.include_router(admin_router)
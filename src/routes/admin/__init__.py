@@ -2,8 +2,10 @@ from fastapi import APIRouter
 
 from .comments import router as comments_router
 from .photos import router as photos_router
+from .users import router as users_router
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 router.include_router(photos_router)
 router.include_router(comments_router)
+router.include_router(users_router)
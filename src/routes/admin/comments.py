@@ -3,11 +3,11 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Path, status
 
-from src.core.models import CommentOrm, UserOrm
+from src.core.models import CommentOrm
 from src.dependencies import db_dependency
 from src.repository import comments_crud
-from src.schemas import CommentDto, CommentUpdateDto, UserRoles
-from src.services import auth_service
+from src.schemas import CommentDto, CommentUpdateDto, CurrentUser, UserRoles
+from src.services import auth_service, comments_service
 
 router = APIRouter(prefix="/comments")
 
@@ -31,7 +31,7 @@ async def comment_by_uuid(
 
 comment_orm_dependency = Annotated[CommentOrm, Depends(comment_by_uuid)]
 moderator_or_higher_permission = Annotated[
-    UserOrm,
+    CurrentUser,
     Depends(auth_service.user_with_role(roles={UserRoles.MODERATOR, UserRoles.ADMIN})),
 ]
 
@@ -57,4 +57,4 @@ async def delete_user_comment(
     session: db_dependency,
     comment_orm: comment_orm_dependency,
 ):
-    await comments_crud.delete_comment(session=session, comment_orm=comment_orm)
+    await comments_service.delete_comment(session=session, comment_orm=comment_orm)
@@ -1,14 +1,28 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Path, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Response, status
 
+from src.constants import NEXT_CURSOR_HEADER
 from src.core import cloudinary_cli
-from src.core.models import PhotoOrm, UserOrm
-from src.dependencies import db_dependency, limit_param, offset_param
+from src.core.models import PhotoOrm
+from src.dependencies import (
+    cursor_dependency,
+    db_dependency,
+    limit_param,
+    offset_param,
+    photo_fields_dependency,
+)
 from src.repository import photos_crud
-from src.schemas import PhotoDto, PhotoUpdateDto, UserRoles
-from src.services import auth_service
+from src.schemas import (
+    CurrentUser,
+    Cursor,
+    PhotoDto,
+    PhotoUpdateDto,
+    UserRoles,
+    photo_fields_adapter,
+)
+from src.services import auth_service, photos_cache
 
 router = APIRouter(prefix="/photos")
 
@@ -32,7 +46,7 @@ async def photo_by_uuid(
 
 photo_orm_dependency = Annotated[PhotoOrm, Depends(photo_by_uuid)]
 admin_permission = Annotated[
-    UserOrm,
+    CurrentUser,
     Depends(auth_service.user_with_role(roles={UserRoles.ADMIN})),
 ]
 
@@ -42,6 +56,9 @@ async def get_user_photos(
     user: admin_permission,
     session: db_dependency,
     user_id: int,
+    response: Response,
+    cursor: cursor_dependency,
+    fields: photo_fields_dependency,
     offset: offset_param = 0,
     limit: limit_param = 10,
 ):
@@ -50,7 +67,21 @@ async def get_user_photos(
         owner_id=user_id,
         offset=offset,
         limit=limit,
+        cursor=cursor,
+        fields=fields,
     )
+    headers = {}
+    if next_cursor := Cursor.next_page(photos, limit):
+        headers[NEXT_CURSOR_HEADER] = next_cursor.encode()
+    if fields:
+        # photo objects with some attributes unloaded, not rows, hence the adapter
+        adapter = photo_fields_adapter(fields)
+        return Response(
+            content=adapter.dump_json(adapter.validate_python(photos)),
+            media_type="application/json",
+            headers=headers,
+        )
+    response.headers.update(headers)
     return photos
 
 
@@ -66,6 +97,7 @@ async def update_user_photo(
         photo_orm=photo_orm,
         body=photo_update,
     )
+    await photos_cache.invalidate(owner_id=photo.owner_id, photo_uuid=photo.uuid)
     return photo
 
 
@@ -77,3 +109,6 @@ async def delete_user_photo(
 ):
     await cloudinary_cli.destroy_image(photo_uuid=photo_orm.uuid)
     await photos_crud.delete_photo(session=session, photo_orm=photo_orm)
+    await photos_cache.invalidate(
+        owner_id=photo_orm.owner_id, photo_uuid=photo_orm.uuid
+    )
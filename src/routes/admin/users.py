@@ -0,0 +1,48 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Path, status
+
+from src.core.models import UserOrm
+from src.dependencies import db_dependency
+from src.repository import users_crud
+from src.schemas import CurrentUser, UserAdminUpdateDto, UserDto, UserRoles
+from src.services import auth_service
+
+router = APIRouter(prefix="/users")
+
+
+async def user_by_id(
+    session: db_dependency,
+    user_id: Annotated[int, Path()],
+) -> UserOrm:
+    """Dependency resolver: returns UserOrm by path id or raises 404."""
+    user = await users_crud.get_user_by_id(session=session, user_id=user_id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User '{user_id}' not found",
+        )
+    return user
+
+
+user_orm_dependency = Annotated[UserOrm, Depends(user_by_id)]
+admin_permission = Annotated[
+    CurrentUser,
+    Depends(auth_service.user_with_role(roles={UserRoles.ADMIN})),
+]
+
+
+@router.patch("/{user_id}", response_model=UserDto)
+async def update_user(
+    user: admin_permission,
+    session: db_dependency,
+    user_orm: user_orm_dependency,
+    user_update: UserAdminUpdateDto,
+):
+    updated = await users_crud.update_user(
+        session=session,
+        user_orm=user_orm,
+        body=user_update,
+    )
+    await auth_service.invalidate_user(updated.id)
+    return updated
@@ -6,7 +6,7 @@ from src.constants import REFRESH_TOKEN_TYPE
 from src.core.models import UserOrm
 from src.dependencies import db_dependency, token_service_dependency
 from src.repository import users_crud
-from src.schemas import TokenInfo, UserCreateDto, UserDto
+from src.schemas import CurrentUser, TokenInfo, UserCreateDto, UserDto
 from src.services import PasswordHashService, auth_service
 
 router = APIRouter(
@@ -34,7 +34,7 @@ async def signup(
             status_code=status.HTTP_409_CONFLICT,
             detail="User already exists",
         )
-    user_create.password = PasswordHashService().hash(user_create.password)
+    user_create.password = await PasswordHashService().hash_async(user_create.password)
     return await users_crud.create_user(session, user_create)
 
 
@@ -59,7 +59,7 @@ async def login(
 )
 async def refresh_access_token(
     user: Annotated[
-        UserOrm,
+        CurrentUser,
         Depends(auth_service.get_current_user(from_token_type=REFRESH_TOKEN_TYPE)),
     ],
     token_service: token_service_dependency,
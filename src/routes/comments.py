@@ -1,12 +1,27 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Path, status
-
-from src.core.models import CommentOrm, PhotoOrm
-from src.dependencies import db_dependency, limit_param, offset_param, user_dependency
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response, status
+
+from src.constants import NEXT_CURSOR_HEADER
+from src.core.models import CommentOrm
+from src.dependencies import (
+    cursor_dependency,
+    db_dependency,
+    limit_param,
+    offset_param,
+    principal_dependency,
+    user_dependency,
+)
 from src.repository import comments_crud, photos_crud
-from src.schemas import CommentCreateDto, CommentDto, CommentUpdateDto
+from src.responses import (
+    RowsJSONResponse,
+    is_not_modified,
+    make_etag,
+    validator_headers,
+)
+from src.schemas import CommentCreateDto, CommentDto, CommentUpdateDto, Cursor
+from src.services import comments_service
 
 router = APIRouter(
     prefix="/comments",
@@ -14,21 +29,21 @@ router = APIRouter(
 )
 
 
-async def photo_by_uuid(
+def photo_not_found(photo_uuid: UUID) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Photo '{photo_uuid}' not found",
+    )
+
+
+async def existing_photo_uuid(
     session: db_dependency,
     photo_uuid: Annotated[UUID, Path()],
-) -> PhotoOrm:
-    """Dependency resolver: returns PhotoOrm by path UUID or raises 404."""
-    photo = await photos_crud.get_photo_by_uuid(
-        session=session,
-        photo_uuid=photo_uuid,
-    )
-    if photo is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Photo '{photo_uuid}' not found",
-        )
-    return photo
+) -> UUID:
+    """Dependency resolver: returns path UUID of an existing photo or raises 404."""
+    if not await photos_crud.photo_exists(session=session, photo_uuid=photo_uuid):
+        raise photo_not_found(photo_uuid)
+    return photo_uuid
 
 
 async def comment_by_uuid(
@@ -50,7 +65,7 @@ async def comment_by_uuid(
     return comment
 
 
-photo_orm_dependency = Annotated[PhotoOrm, Depends(photo_by_uuid)]
+photo_uuid_dependency = Annotated[UUID, Depends(existing_photo_uuid)]
 comment_orm_dependency = Annotated[CommentOrm, Depends(comment_by_uuid)]
 
 
@@ -62,39 +77,47 @@ comment_orm_dependency = Annotated[CommentOrm, Depends(comment_by_uuid)]
 async def create_comment(
     session: db_dependency,
     user: user_dependency,
-    photo_orm: photo_orm_dependency,
+    photo_uuid: Annotated[UUID, Path()],
     comment_create: CommentCreateDto,
 ):
-    comment = await comments_crud.create_comment(
+    comment = await comments_service.create_comment(
         session=session,
-        photo_uuid=photo_orm.uuid,
+        photo_uuid=photo_uuid,
         user_id=user.id,
         body=comment_create,
     )
+    if comment is None:
+        raise photo_not_found(photo_uuid)
     return comment
 
 
 @router.get("/photo/{photo_uuid}", response_model=list[CommentDto])
 async def get_comments_by_photo(
     session: db_dependency,
-    user: user_dependency,
-    photo_orm: photo_orm_dependency,
+    user: principal_dependency,
+    photo_uuid: photo_uuid_dependency,
+    cursor: cursor_dependency,
     offset: offset_param = 0,
     limit: limit_param = 10,
 ):
     comments = await comments_crud.get_comments_by_photo(
         session=session,
-        photo_uuid=photo_orm.uuid,
+        photo_uuid=photo_uuid,
         offset=offset,
         limit=limit,
+        cursor=cursor,
     )
-    return comments
+    response = RowsJSONResponse(comments)
+    if next_cursor := Cursor.next_page(comments, limit):
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor.encode()
+    return response
 
 
 @router.get("/comments", response_model=list[CommentDto])
 async def get_comments(
     session: db_dependency,
-    user: user_dependency,
+    user: principal_dependency,
+    cursor: cursor_dependency,
     offset: offset_param = 0,
     limit: limit_param = 10,
 ):
@@ -103,15 +126,27 @@ async def get_comments(
         user_id=user.id,
         offset=offset,
         limit=limit,
+        cursor=cursor,
     )
-    return comments
+    response = RowsJSONResponse(comments)
+    if next_cursor := Cursor.next_page(comments, limit):
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor.encode()
+    return response
 
 
 @router.get("/comment/{comment_uuid}", response_model=CommentDto)
 async def get_comment_by_uuid(
     session: db_dependency,
     comment_orm: comment_orm_dependency,
+    request: Request,
+    response: Response,
 ):
+    etag = make_etag(comment_orm.uuid, comment_orm.updated_at.isoformat())
+    headers = validator_headers(etag, comment_orm.updated_at)
+    if is_not_modified(request, etag, comment_orm.updated_at):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
     return comment_orm
 
 
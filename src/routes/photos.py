@@ -1,6 +1,8 @@
+import asyncio
 from typing import Annotated
 from uuid import UUID, uuid4
 
+from cloudinary.exceptions import Error as CloudinaryError
 from fastapi import (
     APIRouter,
     Depends,
@@ -9,23 +11,45 @@ from fastapi import (
     HTTPException,
     Path,
     Query,
+    Request,
+    Response,
     UploadFile,
     status,
 )
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core import cloudinary_cli
+from src.constants import MAX_EMBEDDED_COMMENTS, NEXT_CURSOR_HEADER
+from src.core import ImageStorageError, cloudinary_cli, settings
 from src.core.models import PhotoOrm
-from src.dependencies import db_dependency, limit_param, offset_param, user_dependency
-from src.repository import photos_crud
+from src.dependencies import (
+    cursor_dependency,
+    db_dependency,
+    limit_param,
+    offset_param,
+    photo_fields_dependency,
+    principal_dependency,
+    user_dependency,
+)
+from src.repository import comments_crud, photos_crud
+from src.responses import is_not_modified, make_etag, validator_headers
 from src.schemas import (
+    CommentDto,
+    Cursor,
+    PhotoBatchItemDto,
+    PhotoBatchResultDto,
     PhotoCreateDto,
     PhotoDto,
     PhotoTransformedDto,
     PhotoUpdateDto,
+    PhotoWithCommentsDto,
+    TagMatch,
     TagsParam,
     TransformRequest,
+    UploadImageResult,
 )
-from src.services import photos_service
+from src.services import MultipartFileStream, photos_cache, photos_service
 
 router = APIRouter(prefix="/photos", tags=["photos"])
 
@@ -49,38 +73,195 @@ async def photo_by_uuid(
     return photo
 
 
+def include_from_query(
+    include: Annotated[
+        str | None,
+        Query(
+            pattern=r"^comments:\d+$",
+            description="Embed newest comments of every photo, e.g. `comments:3`",
+        ),
+    ] = None,
+) -> int:
+    """Dependency resolver: returns number of comments to embed per photo."""
+    if include is None:
+        return 0
+    count = int(include.removeprefix("comments:"))
+    if count > MAX_EMBEDDED_COMMENTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"No more than {MAX_EMBEDDED_COMMENTS} comments can be embedded",
+        )
+    return count
+
+
 photo_orm_dependency = Annotated[PhotoOrm, Depends(photo_by_uuid)]
+include_comments_dependency = Annotated[int, Depends(include_from_query)]
+batch_items_adapter = TypeAdapter(list[PhotoBatchItemDto])
+photos_with_comments_adapter = TypeAdapter(list[PhotoWithCommentsDto])
+
+# body is parsed by MultipartFileStream, so it has to be documented by hand
+upload_photo_openapi = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {
+                        "file": {"type": "string", "format": "binary"},
+                        "description": {
+                            "type": "string",
+                            "minLength": 1,
+                            "maxLength": 255,
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
 
 
 @router.post(
     "/upload",
     response_model=PhotoDto,
     status_code=status.HTTP_201_CREATED,
+    openapi_extra=upload_photo_openapi,
 )
 async def upload_photo(
     session: db_dependency,
     user: user_dependency,
-    file: Annotated[UploadFile, File()],
+    request: Request,
     tags: Annotated[TagsParam, Query()],
-    description: Annotated[str | None, Form(min_length=1, max_length=255)] = None,
 ):
     photo_uuid = uuid4()
-    upload_result = await cloudinary_cli.upload_image(
+    stream = MultipartFileStream(
+        request=request,
+        file_field="file",
+        max_size=settings.cloudinary.max_upload_size,
+    )
+    upload_result = await cloudinary_cli.upload_image_stream(
         photo_uuid=photo_uuid,
-        file=file.file,
+        chunks=stream.chunks(),
         user_id=user.id,
     )
+    try:
+        form = PhotoUpdateDto(description=stream.fields.get("description"))
+    except ValidationError as exc:
+        await cloudinary_cli.destroy_image(photo_uuid=photo_uuid)
+        raise RequestValidationError(exc.errors(include_url=False))
+
     photo_create = PhotoCreateDto(
         uuid=photo_uuid,
         owner_id=user.id,
         cloudinary_url=upload_result.secure_url,
-        description=description,
+        description=form.description,
     )
-    return await photos_service.create_photo_with_tags(
+    photo = await photos_service.create_photo_with_tags(
         session=session,
         photo_create=photo_create,
         tags_param=tags,
     )
+    await photos_cache.invalidate(owner_id=user.id)
+    return photo
+
+
+@router.post(
+    "/upload/batch",
+    response_model=list[PhotoBatchResultDto],
+    status_code=status.HTTP_207_MULTI_STATUS,
+)
+async def upload_photos_batch(
+    session: db_dependency,
+    user: user_dependency,
+    files: Annotated[list[UploadFile], File()],
+    items: Annotated[
+        str | None,
+        Form(description="JSON list of {description, tags}, one object per file"),
+    ] = None,
+):
+    if len(files) > settings.cloudinary.batch_max_files:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"No more than {settings.cloudinary.batch_max_files} files allowed",
+        )
+    try:
+        metadata = (
+            batch_items_adapter.validate_json(items)
+            if items
+            else [PhotoBatchItemDto() for _ in files]
+        )
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors(include_url=False))
+    if len(metadata) != len(files):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Items must describe every uploaded file",
+        )
+
+    max_size = settings.cloudinary.max_upload_size
+    semaphore = asyncio.Semaphore(settings.cloudinary.batch_upload_concurrency)
+
+    async def upload(photo_uuid: UUID, file: UploadFile) -> UploadImageResult | str:
+        """Upload a single file, returning the error message on failure."""
+        # spooled by Starlette as a whole, so its size is known upfront
+        if file.size is not None and file.size > max_size:
+            return f"File exceeds maximum size of {max_size} bytes"
+
+        async with semaphore:
+            try:
+                return await cloudinary_cli.upload_image(
+                    photo_uuid=photo_uuid,
+                    file=file.file,
+                    user_id=user.id,
+                )
+            except (ImageStorageError, CloudinaryError) as exc:
+                return str(exc)
+            except Exception:
+                # one broken file must not fail the whole batch
+                return "Upload failed"
+
+    photo_uuids = [uuid4() for _ in files]
+    uploads = await asyncio.gather(*map(upload, photo_uuids, files))
+
+    results = [
+        PhotoBatchResultDto(index=index, filename=file.filename)
+        for index, file in enumerate(files)
+    ]
+    created: list[tuple[PhotoBatchResultDto, PhotoCreateDto, PhotoBatchItemDto]] = []
+    for result, photo_uuid, item, uploaded in zip(
+        results, photo_uuids, metadata, uploads, strict=True
+    ):
+        if isinstance(uploaded, str):
+            result.error = uploaded
+            continue
+        photo_create = PhotoCreateDto(
+            uuid=photo_uuid,
+            owner_id=user.id,
+            cloudinary_url=uploaded.secure_url,
+            description=item.description,
+        )
+        created.append((result, photo_create, item))
+
+    if not created:
+        return results
+
+    try:
+        photos = await photos_service.create_photos_with_tags(
+            session=session,
+            items=[(photo_create, item) for _, photo_create, item in created],
+        )
+    except Exception:
+        await asyncio.gather(
+            *(cloudinary_cli.destroy_image(photo_uuid=p.uuid) for _, p, _ in created)
+        )
+        raise
+
+    for (result, _, _), photo in zip(created, photos, strict=True):
+        result.photo = PhotoDto.model_validate(photo)
+    await photos_cache.invalidate(owner_id=user.id)
+    return results
 
 
 @router.post(
@@ -102,30 +283,171 @@ async def create_photo_transformation(
         photo_orm=photo_orm,
         transformed_url=transformed_url,
     )
+    await photos_cache.invalidate(
+        owner_id=photo_orm.owner_id, photo_uuid=photo_orm.uuid
+    )
     return transformed
 
 
-@router.get("", response_model=list[PhotoDto])
+def _attributes(obj: object, dto: type[BaseModel]) -> dict:
+    """Read attributes of `obj` named after the fields of `dto`, unvalidated."""
+    return {name: getattr(obj, name) for name in dto.model_fields}
+
+
+async def get_photos_with_comments(
+    session: AsyncSession,
+    owner_id: int,
+    offset: int,
+    limit: int,
+    cursor: Cursor | None,
+    comments_limit: int,
+) -> Response:
+    """Build a page of photos embedding their newest comments, bypassing the cache."""
+    photos = await photos_crud.get_photos(
+        session=session,
+        owner_id=owner_id,
+        offset=offset,
+        limit=limit,
+        cursor=cursor,
+    )
+    latest_comments = await comments_crud.get_latest_comments_by_photos(
+        session=session,
+        photo_uuids=[photo.uuid for photo in photos],
+        limit=comments_limit,
+    )
+    # nested ORM objects are read from attributes, every row is validated once
+    items = photos_with_comments_adapter.validate_python(
+        [
+            {
+                **_attributes(photo, PhotoDto),
+                "latest_comments": [
+                    {**_attributes(comment, CommentDto), "user_email": email}
+                    for comment, email in latest_comments[photo.uuid]
+                ],
+            }
+            for photo in photos
+        ],
+        from_attributes=True,
+    )
+
+    response = Response(
+        content=photos_with_comments_adapter.dump_json(items),
+        media_type="application/json",
+    )
+    if next_cursor := Cursor.next_page(photos, limit):
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor.encode()
+    return response
+
+
+@router.get("", response_model=list[PhotoDto] | list[PhotoWithCommentsDto])
 async def get_all_photos(
     session: db_dependency,
-    user: user_dependency,
+    user: principal_dependency,
+    cursor: cursor_dependency,
+    include_comments: include_comments_dependency,
+    fields: photo_fields_dependency,
     offset: offset_param = 0,
     limit: limit_param = 10,
 ):
-    photos = await photos_crud.get_photos(
+    if include_comments and fields:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Fields cannot be combined with embedded comments",
+        )
+    if include_comments:
+        return await get_photos_with_comments(
+            session, user.id, offset, limit, cursor, include_comments
+        )
+
+    page_key = await photos_cache.page_key(user.id, offset, limit, cursor, fields)
+    if cached := await photos_cache.get_page(page_key):
+        payload, next_cursor = cached
+    else:
+        photos = await photos_crud.get_photos(
+            session=session,
+            owner_id=user.id,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            fields=fields,
+        )
+        if next_page := Cursor.next_page(photos, limit):
+            next_cursor = next_page.encode()
+        else:
+            next_cursor = None
+        payload = await photos_cache.set_page(page_key, photos, next_cursor, fields)
+
+    response = Response(content=payload, media_type="application/json")
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return response
+
+
+@router.get("/search", response_model=list[PhotoDto])
+async def search_photos_by_tags(
+    session: db_dependency,
+    user: principal_dependency,
+    response: Response,
+    tags: Annotated[TagsParam, Query()],
+    cursor: cursor_dependency,
+    match: TagMatch = TagMatch.ANY,
+    limit: limit_param = 10,
+):
+    if not tags.tags:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one tag is required",
+        )
+    photos = await photos_crud.search_photos_by_tags(
         session=session,
-        owner_id=user.id,
-        offset=offset,
+        names=tags.tags,
+        match_all=match == TagMatch.ALL,
         limit=limit,
+        cursor=cursor,
     )
+    if next_cursor := Cursor.next_page(photos, limit):
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor.encode()
     return photos
 
 
 @router.get("/{photo_uuid}", response_model=PhotoDto)
 async def get_photo_by_uuid(
-    photo_orm: photo_orm_dependency,
+    session: db_dependency,
+    user: principal_dependency,
+    request: Request,
+    photo_uuid: Annotated[UUID, Path()],
 ):
-    return photo_orm
+    version = await photos_crud.get_photo_version(
+        session=session,
+        photo_uuid=photo_uuid,
+        owner_id=user.id,
+    )
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Photo '{photo_uuid}' not found",
+        )
+
+    # comments and transformations change the photo without moving `updated_at`,
+    # deleted ones leave no date behind: revalidated by entity tag only
+    etag = make_etag(
+        photo_uuid,
+        version.updated_at.isoformat(),
+        version.comments_count,
+        version.transformations_count,
+    )
+    headers = validator_headers(etag, last_modified=None)
+    if is_not_modified(request, etag, last_modified=None):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if (payload := await photos_cache.get_photo(user.id, photo_uuid, etag)) is None:
+        photo_orm = await photo_by_uuid(
+            session=session,
+            user=user,
+            photo_uuid=photo_uuid,
+        )
+        payload = await photos_cache.set_photo(photo_orm, etag)
+    return Response(content=payload, media_type="application/json", headers=headers)
 
 
 @router.put("/{photo_uuid}", response_model=PhotoDto)
@@ -139,6 +461,7 @@ async def update_photo(
         photo_orm=photo_orm,
         body=photo_update,
     )
+    await photos_cache.invalidate(owner_id=photo.owner_id, photo_uuid=photo.uuid)
     return photo
 
 
@@ -149,3 +472,6 @@ async def delete_photo(
 ):
     await cloudinary_cli.destroy_image(photo_uuid=photo_orm.uuid)
     await photos_crud.delete_photo(session=session, photo_orm=photo_orm)
+    await photos_cache.invalidate(
+        owner_id=photo_orm.owner_id, photo_uuid=photo_orm.uuid
+    )
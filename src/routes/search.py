@@ -0,0 +1,47 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Query
+
+from src.dependencies import (
+    db_dependency,
+    limit_param,
+    offset_param,
+    principal_dependency,
+)
+from src.repository import comments_crud, photos_crud
+from src.schemas import SearchResultsDto
+
+router = APIRouter(
+    prefix="/search",
+    tags=["search"],
+)
+
+
+@router.get("", response_model=SearchResultsDto)
+async def search(
+    session: db_dependency,
+    user: principal_dependency,
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    offset: offset_param = 0,
+    limit: limit_param = 10,
+):
+    photos = await photos_crud.search_photos_by_text(
+        session=session,
+        query=q,
+        offset=offset,
+        limit=limit,
+    )
+    comments = await comments_crud.search_comments_by_text(
+        session=session,
+        query=q,
+        offset=offset,
+        limit=limit,
+    )
+    return SearchResultsDto.model_validate(
+        {
+            "photos": [{"rank": rank, "photo": photo} for photo, rank in photos],
+            "comments": [
+                {"rank": rank, "comment": comment} for comment, rank in comments
+            ],
+        }
+    )
@@ -0,0 +1,40 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Query
+
+from src.dependencies import db_dependency, limit_param, principal_dependency
+from src.repository import tags_crud
+from src.schemas import TagUsageDto
+from src.services import tags_suggest
+
+router = APIRouter(
+    prefix="/tags",
+    tags=["tags"],
+)
+
+
+@router.get("/popular", response_model=list[TagUsageDto])
+async def get_popular_tags(
+    session: db_dependency,
+    user: principal_dependency,
+    limit: limit_param = 10,
+):
+    return await tags_crud.get_popular_tags(session=session, limit=limit)
+
+
+@router.get("/suggest", response_model=list[TagUsageDto])
+async def suggest_tags(
+    session: db_dependency,
+    user: principal_dependency,
+    prefix: Annotated[str, Query(min_length=1, max_length=50)],
+    limit: limit_param = 10,
+):
+    suggestions = await tags_suggest.suggest(
+        session=session,
+        prefix=prefix,
+        limit=limit,
+    )
+    return [
+        TagUsageDto(name=name, usage_count=usage_count)
+        for name, usage_count in suggestions
+    ]
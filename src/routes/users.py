@@ -1,6 +1,7 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, status
 
-from src.dependencies import user_dependency
+from src.dependencies import db_dependency, principal_dependency
+from src.repository import users_crud
 from src.schemas import UserDto
 
 router = APIRouter(
@@ -10,5 +11,12 @@ router = APIRouter(
 
 
 @router.get("/me", response_model=UserDto)
-async def get_me(user: user_dependency):
-    return user
+async def get_me(session: db_dependency, user: principal_dependency):
+    user_orm = await users_crud.get_user_by_id(session=session, user_id=user.id)
+    if user_orm is None:
+        # deleted after the token was issued
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate user",
+        )
+    return user_orm
@@ -3,31 +3,56 @@ __all__ = (
     "UploadImageResult",
     "CommentCreateDto",
     "CommentDto",
+    "CommentPreviewDto",
     "CommentUpdateDto",
+    "TagMatch",
     "UserRoles",
     "HealthResponse",
+    "ReadinessResponse",
+    "Cursor",
+    "PhotoBatchItemDto",
+    "PhotoBatchResultDto",
     "PhotoCreateDto",
     "PhotoDto",
     "PhotoTransformedDto",
     "PhotoUpdateDto",
+    "PhotoWithCommentsDto",
+    "photo_fields_adapter",
+    "CommentSearchHitDto",
+    "PhotoSearchHitDto",
+    "SearchResultsDto",
+    "TagUsageDto",
     "TagsDto",
     "TagsParam",
     "TokenData",
     "TokenInfo",
+    "CurrentUser",
+    "UserAdminUpdateDto",
     "UserCreateDto",
     "UserDto",
 )
 
 from .cloudinary import TransformRequest, UploadImageResult
-from .comments import CommentCreateDto, CommentDto, CommentUpdateDto
-from .enums import UserRoles
-from .meta import HealthResponse
+from .comments import (
+    CommentCreateDto,
+    CommentDto,
+    CommentPreviewDto,
+    CommentUpdateDto,
+)
+from .enums import TagMatch, UserRoles
+from .meta import HealthResponse, ReadinessResponse
+from .pagination import Cursor
 from .photos import (
+    PhotoBatchItemDto,
+    PhotoBatchResultDto,
     PhotoCreateDto,
     PhotoDto,
     PhotoTransformedDto,
     PhotoUpdateDto,
+    PhotoWithCommentsDto,
+    photo_fields_adapter,
 )
-from .tags import TagsDto, TagsParam
+from .search import CommentSearchHitDto, PhotoSearchHitDto, SearchResultsDto
+from .tags import TagsDto, TagsParam, TagUsageDto
 from .token import TokenData, TokenInfo
-from .users import UserCreateDto, UserDto
+from .users import CurrentUser, UserAdminUpdateDto, UserCreateDto, UserDto
@@ -20,6 +20,10 @@ class CommentDto(CommentBaseDto):
     updated_at: datetime
 
 
+class CommentPreviewDto(CommentDto):
+    user_email: str
+
+
 class CommentCreateDto(CommentBaseDto):
     pass
 
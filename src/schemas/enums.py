@@ -5,3 +5,8 @@ class UserRoles(str, Enum):
     USER = "user"
     MODERATOR = "moderator"
     ADMIN = "admin"
+
+
+class TagMatch(str, Enum):
+    ANY = "any"
+    ALL = "all"
@@ -3,3 +3,9 @@ from pydantic import BaseModel
 
 class HealthResponse(BaseModel):
     status: str
+
+
+class ReadinessResponse(HealthResponse):
+    database: str
+    db_pool_saturation: float
+    storage_saturation: float
@@ -0,0 +1,41 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Protocol, Self, Sequence
+from uuid import UUID
+
+from pydantic import BaseModel, ValidationError
+
+
+class Paginated(Protocol):
+    created_at: datetime
+    uuid: UUID
+
+
+class Cursor(BaseModel):
+    """Opaque keyset position: the (created_at, uuid) of the last seen row."""
+
+    created_at: datetime
+    uuid: UUID
+
+    def encode(self) -> str:
+        """Return url-safe opaque representation of the cursor."""
+        raw = self.model_dump_json().encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, value: str) -> Self:
+        """Parse cursor produced by `encode`, raising ValueError when malformed."""
+        try:
+            padded = value + "=" * (-len(value) % 4)
+            return cls.model_validate_json(base64.urlsafe_b64decode(padded))
+        except (binascii.Error, ValidationError):
+            raise ValueError("malformed cursor")
+
+    @classmethod
+    def next_page(cls, items: Sequence[Paginated], limit: int) -> Self | None:
+        """Return cursor pointing after the last item if the page is full."""
+        if len(items) < limit:
+            return None
+        last = items[-1]
+        return cls(created_at=last.created_at, uuid=last.uuid)
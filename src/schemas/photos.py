@@ -1,9 +1,11 @@
 from datetime import datetime
+from functools import lru_cache
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, create_model
 
-from .tags import TagsDto
+from .comments import CommentPreviewDto
+from .tags import TagsDto, TagsParam
 
 
 class BaseModelWithConfig(BaseModel):
@@ -30,10 +32,44 @@ class PhotoCreateDto(PhotoBaseDto):
 class PhotoDto(PhotoBaseDto):
     created_at: datetime
     updated_at: datetime
+    comments_count: int
 
     tags: list[TagsDto]
     transformations: list[PhotoTransformedDto]
 
 
+@lru_cache
+def photo_fields_adapter(fields: frozenset[str]) -> TypeAdapter:
+    """Return adapter serializing lists of photos restricted to `fields` of PhotoDto.
+
+    Only the selected attributes are read, so unloaded ones are never touched.
+    """
+    model = create_model(
+        "PhotoFieldsDto",
+        __base__=BaseModelWithConfig,
+        **{
+            name: (info.annotation, info)
+            for name, info in PhotoDto.model_fields.items()
+            if name in fields
+        },
+    )
+    return TypeAdapter(list[model])
+
+
+class PhotoWithCommentsDto(PhotoDto):
+    latest_comments: list[CommentPreviewDto]
+
+
 class PhotoUpdateDto(BaseModel):
     description: str | None = Field(default=None, min_length=1, max_length=255)
+
+
+class PhotoBatchItemDto(TagsParam):
+    description: str | None = Field(default=None, min_length=1, max_length=255)
+
+
+class PhotoBatchResultDto(BaseModel):
+    index: int
+    filename: str | None = None
+    photo: PhotoDto | None = None
+    error: str | None = None
@@ -0,0 +1,17 @@
+from .comments import CommentDto
+from .photos import BaseModelWithConfig, PhotoDto
+
+
+class PhotoSearchHitDto(BaseModelWithConfig):
+    rank: float
+    photo: PhotoDto
+
+
+class CommentSearchHitDto(BaseModelWithConfig):
+    rank: float
+    comment: CommentDto
+
+
+class SearchResultsDto(BaseModelWithConfig):
+    photos: list[PhotoSearchHitDto]
+    comments: list[CommentSearchHitDto]
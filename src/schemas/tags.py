@@ -15,6 +15,13 @@ class TagsParam(BaseModel):
         return list(sorted(unique_tags))
 
 
+class TagUsageDto(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    name: str
+    usage_count: int
+
+
 class TagsDto(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -1,11 +1,17 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from .enums import UserRoles
 
 
 class TokenData(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     user_id: int
     role: UserRoles | None = None
+    sub: str | None = None
+    iat: float | None = None
+    # absent from tokens issued before the claim was added
+    is_active: bool = True
 
 
 class TokenInfo(BaseModel):
@@ -22,3 +22,19 @@ class UserDto(UserBaseDto):
 
 class UserCreateDto(UserBaseDto):
     password: str = Field(min_length=6)
+
+
+class UserAdminUpdateDto(BaseModel):
+    role: UserRoles | None = None
+    is_active: bool | None = None
+
+
+class CurrentUser(BaseModel):
+    """Slim authenticated user record, cheap to keep in memory."""
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    id: int
+    email: str
+    role: UserRoles
+    is_active: bool
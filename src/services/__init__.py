@@ -1,11 +1,20 @@
 __all__ = (
     "auth_service",
+    "comments_service",
+    "health_service",
+    "photos_cache",
     "photos_service",
+    "tags_suggest",
+    "MultipartFileStream",
     "PasswordHashService",
     "TokenService",
 )
 
 from . import auth as auth_service
+from . import comments as comments_service
+from . import health as health_service
 from . import photos as photos_service
+from . import photos_cache, tags_suggest
 from .security import PasswordHashService
 from .token import TokenService
+from .uploads import MultipartFileStream
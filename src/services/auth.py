@@ -1,3 +1,4 @@
+import time
 from typing import Annotated
 
 from fastapi import Depends, Form, HTTPException, status
@@ -6,10 +7,10 @@ from pydantic import EmailStr
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.constants import ACCESS_TOKEN_TYPE
-from src.core import db_helper
+from src.core import TTLCache, cache_backend, db_helper, settings
 from src.core.models import UserOrm
 from src.repository import users_crud
-from src.schemas import UserRoles
+from src.schemas import CurrentUser, UserRoles
 
 from .security import PasswordHashService
 from .token import TokenService
@@ -19,6 +20,53 @@ db_dependency = Annotated[AsyncSession, Depends(db_helper.session_getter)]
 creds_dependency = Annotated[HTTPAuthorizationCredentials, Depends(HTTPBearer())]
 token_service_dependency = Annotated[TokenService, Depends(TokenService)]
 
+users_cache: TTLCache[int, CurrentUser] = TTLCache(
+    maxsize=settings.user_cache.maxsize,
+    ttl=settings.user_cache.ttl,
+    name="user_cache",
+)
+
+
+# user id -> time of revocation, 0 when not revoked, as last read from the
+# shared cache: most requests do not wait for a round-trip to Redis
+revocations_cache: TTLCache[int, float] = TTLCache(
+    maxsize=settings.user_cache.maxsize,
+    ttl=settings.user_cache.revocation_ttl,
+    name="revocation_cache",
+)
+
+
+def _revoked_key(user_id: int) -> str:
+    return f"user:revoked:{user_id}"
+
+
+async def revoked_at(user_id: int) -> float | None:
+    """Return unix time the user was last revoked at, if within token lifetime.
+
+    Kept in the shared `cache_backend`, so a revocation reaches every worker
+    when it is backed by Redis, within `revocation_ttl` seconds.
+    """
+    if (revoked := revocations_cache.get(user_id)) is None:
+        value = await cache_backend.get(_revoked_key(user_id))
+        revoked = 0.0 if value is None else float(value)
+        revocations_cache.set(user_id, revoked)
+    return revoked or None
+
+
+async def invalidate_user(user_id: int) -> None:
+    """Drop cached user record and revoke issued access tokens.
+
+    Must be called when role or status of the user changes.
+    """
+    now = time.time()
+    users_cache.pop(user_id)
+    revocations_cache.set(user_id, now)
+    await cache_backend.set(
+        _revoked_key(user_id),
+        repr(now).encode(),
+        ttl=settings.jwt.access_token_expire_minutes * 60,
+    )
+
 
 async def authenticate_user(
     session: db_dependency,
@@ -39,7 +87,7 @@ async def authenticate_user(
             detail="Inactive user",
         )
 
-    if not PasswordHashService().verify(password, user.hashed_password):
+    if not await PasswordHashService().verify_async(password, user.hashed_password):
         raise unauthed_exc
 
     return user
@@ -52,23 +100,74 @@ def get_current_user(from_token_type: str):
         session: db_dependency,
         credentials: creds_dependency,
         token_service: token_service_dependency,
-    ) -> UserOrm:
-        """Decode the token, validate its type, load the user, or raise 401/403."""
+    ) -> CurrentUser:
+        """Decode the token, validate its type, load the user, or raise 401/403.
+
+        Users are served from `users_cache` when possible, so hot users
+        are authenticated without a database round-trip. The cache is per
+        worker, users revoked within the token lifetime are always loaded.
+        """
+        token_data = token_service.decode_token(
+            token=credentials.credentials,
+            token_type=from_token_type,
+        )
+        user = None
+        if await revoked_at(token_data.user_id) is None:
+            user = users_cache.get(token_data.user_id)
+        if user is None:
+            user_orm = await users_crud.get_user_by_id(session, token_data.user_id)
+            if not user_orm:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Could not validate user",
+                )
+            user = CurrentUser.model_validate(user_orm)
+            users_cache.set(user.id, user)
+
+        if not user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Inactive user",
+            )
+        return user
+
+    return dependency
+
+
+def get_token_principal(from_token_type: str):
+    """Return a dependency that builds the current user from token claims only.
+
+    Unlike `get_current_user` it never touches the database, so it should be
+    used only by read-only endpoints that need nothing but id, email, role and
+    status. Claims are trusted until the user is revoked by `invalidate_user`.
+    """
+
+    async def dependency(
+        credentials: creds_dependency,
+        token_service: token_service_dependency,
+    ) -> CurrentUser:
+        """Decode the token, reject it if issued before user revocation or 403."""
         token_data = token_service.decode_token(
             token=credentials.credentials,
             token_type=from_token_type,
         )
-        if not (user := await users_crud.get_user_by_id(session, token_data.user_id)):
+        revoked = await revoked_at(token_data.user_id)
+        if revoked is not None and (token_data.iat or 0) <= revoked:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate user",
+                detail="Token has been revoked",
             )
-        if not user.is_active:
+        if not token_data.is_active:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Inactive user",
             )
-        return user
+        return CurrentUser(
+            id=token_data.user_id,
+            email=token_data.sub,
+            role=token_data.role,
+            is_active=token_data.is_active,
+        )
 
     return dependency
 
@@ -78,10 +177,10 @@ def user_with_role(roles: set[UserRoles]):
 
     async def dependency(
         user: Annotated[
-            UserOrm,
+            CurrentUser,
             Depends(get_current_user(from_token_type=ACCESS_TOKEN_TYPE)),
         ],
-    ) -> UserOrm:
+    ) -> CurrentUser:
         """Checks whether a user role belongs to the `roles` set."""
         if user.role not in roles:
             raise HTTPException(
@@ -0,0 +1,56 @@
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.models import CommentOrm
+from src.repository import comments_crud, photos_crud
+from src.schemas import CommentCreateDto
+
+from . import photos_cache
+
+
+async def create_comment(
+    session: AsyncSession,
+    photo_uuid: UUID,
+    user_id: int,
+    body: CommentCreateDto,
+) -> CommentOrm | None:
+    """Create a comment and count it on the photo in the same transaction.
+
+    Returns None if the photo does not exist.
+    """
+    owner_id = await photos_crud.add_comments_count(
+        session=session,
+        photo_uuid=photo_uuid,
+        delta=1,
+    )
+    if owner_id is None:
+        await session.rollback()
+        return None
+
+    comment = await comments_crud.create_comment(
+        session=session,
+        photo_uuid=photo_uuid,
+        user_id=user_id,
+        body=body,
+    )
+    if comment is not None:
+        await photos_cache.invalidate(owner_id=owner_id, photo_uuid=photo_uuid)
+    return comment
+
+
+async def delete_comment(
+    session: AsyncSession,
+    comment_orm: CommentOrm,
+) -> None:
+    """Delete a comment and uncount it on the photo in the same transaction."""
+    owner_id = await photos_crud.add_comments_count(
+        session=session,
+        photo_uuid=comment_orm.photo_uuid,
+        delta=-1,
+    )
+    await comments_crud.delete_comment(session=session, comment_orm=comment_orm)
+    if owner_id is not None:
+        await photos_cache.invalidate(
+            owner_id=owner_id, photo_uuid=comment_orm.photo_uuid
+        )
@@ -0,0 +1,43 @@
+import asyncio
+import time
+
+from src.core import cloudinary_cli, db_helper, settings
+from src.schemas import ReadinessResponse
+
+_last_result: ReadinessResponse | None = None
+_checked_at = float("-inf")
+_check_lock = asyncio.Lock()
+
+
+async def _check_database() -> str:
+    try:
+        await asyncio.wait_for(db_helper.ping(), timeout=settings.health.db_timeout)
+    except TimeoutError:
+        return "timeout"
+    except Exception:
+        return "error"
+    return "ok"
+
+
+async def check_readiness() -> ReadinessResponse:
+    """Return readiness of the worker, reusing a recent result.
+
+    The worker is ready when the database answers `SELECT 1` within
+    `db_timeout`. An exhausted pool makes the query wait for a connection
+    and time out. Concurrent probes wait for a single check.
+    """
+    global _last_result, _checked_at
+
+    async with _check_lock:
+        if time.monotonic() - _checked_at < settings.health.cache_ttl:
+            return _last_result
+
+        database = await _check_database()
+        _last_result = ReadinessResponse(
+            status="ok" if database == "ok" else "unavailable",
+            database=database,
+            db_pool_saturation=db_helper.pool_saturation,
+            storage_saturation=cloudinary_cli.saturation,
+        )
+        _checked_at = time.monotonic()
+        return _last_result
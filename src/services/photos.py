@@ -1,6 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.models import PhotoOrm, TagOrm
+from src.core.models import PhotoOrm
 from src.repository import photos_crud, tags_crud
 from src.schemas import PhotoCreateDto, TagsParam
 
@@ -11,18 +11,27 @@ async def create_photo_with_tags(
     tags_param: TagsParam,
 ) -> PhotoOrm:
     """Creates a photo and attaches tags to it."""
-    tags = await tags_crud.get_tags_by_names(
+    photos = await create_photos_with_tags(
         session=session,
-        names=tags_param.tags,
+        items=[(photo_create, tags_param)],
     )
-    tags_map = {t.name: t for t in tags}
+    return photos[0]
+
 
-    for name in tags_param.tags:
-        if name not in tags_map:
-            tags.append(TagOrm(name=name))
+async def create_photos_with_tags(
+    session: AsyncSession,
+    items: list[tuple[PhotoCreateDto, TagsParam]],
+) -> list[PhotoOrm]:
+    """Creates many photos at once, resolving tags of all of them together.
+
+    The number of round-trips does not depend on the number of photos or tags.
+    """
+    names = sorted({name for _, tags_param in items for name in tags_param.tags})
+    tags = await tags_crud.upsert_tags(session=session, names=names)
+    tags_map = {t.name: t for t in tags}
 
-    return await photos_crud.create_photo(
+    return await photos_crud.create_photos(
         session=session,
-        body=photo_create,
-        tags=tags,
+        bodies=[photo_create for photo_create, _ in items],
+        tags=[[tags_map[name] for name in tags_param.tags] for _, tags_param in items],
     )
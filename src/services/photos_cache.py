@@ -0,0 +1,112 @@
+import time
+from uuid import UUID
+
+from pydantic import TypeAdapter
+
+from src.core import cache_backend, settings
+from src.core.models import PhotoOrm
+from src.schemas import Cursor, PhotoDto, photo_fields_adapter
+
+photo_adapter = TypeAdapter(PhotoDto)
+photos_adapter = TypeAdapter(list[PhotoDto])
+
+
+def _photo_key(owner_id: int, photo_uuid: UUID) -> str:
+    return f"photo:{owner_id}:{photo_uuid}"
+
+
+def _version_key(owner_id: int) -> str:
+    return f"photos:version:{owner_id}"
+
+
+async def _get_version(owner_id: int) -> bytes:
+    """Return current version of owner listings, starting a new one if missing.
+
+    Listing keys embed the version, so bumping it invalidates every cached
+    page of the owner at once. Versions are timestamps rather than counters
+    to stay unique if the version key is evicted.
+    """
+    if (version := await cache_backend.get(_version_key(owner_id))) is None:
+        version = await _bump_version(owner_id)
+    return version
+
+
+async def _bump_version(owner_id: int) -> bytes:
+    version = str(time.time_ns()).encode()
+    # outlive every page stored under the previous version
+    await cache_backend.set(_version_key(owner_id), version, ttl=settings.cache.ttl * 2)
+    return version
+
+
+async def page_key(
+    owner_id: int,
+    offset: int,
+    limit: int,
+    cursor: Cursor | None,
+    fields: frozenset[str] | None = None,
+) -> str:
+    """Return key of a listing page under the current version of owner listings.
+
+    Read the key once and use it for both `get_page` and `set_page`: a page
+    built after a miss is then stored under the version it was read at, so
+    an invalidation racing with the store makes it unreachable, not stale.
+    """
+    version = (await _get_version(owner_id)).decode()
+    position = cursor.encode() if cursor else ""
+    fieldset = ",".join(sorted(fields)) if fields else ""
+    return f"photos:page:{owner_id}:{version}:{offset}:{limit}:{position}:{fieldset}"
+
+
+async def get_photo(owner_id: int, photo_uuid: UUID, etag: str) -> bytes | None:
+    """Return serialized PhotoDto of the owner's photo, if cached at version `etag`.
+
+    Comparing versions keeps workers from serving entries which another
+    worker's invalidation did not reach.
+    """
+    if (value := await cache_backend.get(_photo_key(owner_id, photo_uuid))) is None:
+        return None
+
+    cached_etag, _, payload = value.partition(b"\n")
+    return payload if cached_etag.decode() == etag else None
+
+
+async def set_photo(photo: PhotoOrm, etag: str) -> bytes:
+    """Serialize photo as PhotoDto JSON and cache it along with its version."""
+    payload = photo_adapter.dump_json(photo_adapter.validate_python(photo))
+    key = _photo_key(photo.owner_id, photo.uuid)
+    # entity tags are quoted hex digests, so they never contain a newline
+    await cache_backend.set(
+        key, etag.encode() + b"\n" + payload, ttl=settings.cache.ttl
+    )
+    return payload
+
+
+async def get_page(key: str) -> tuple[bytes, str | None] | None:
+    """Return serialized page of PhotoDto and its next cursor, if cached."""
+    if (value := await cache_backend.get(key)) is None:
+        return None
+
+    next_cursor, _, payload = value.partition(b"\n")
+    return payload, next_cursor.decode() or None
+
+
+async def set_page(
+    key: str,
+    photos: list[PhotoOrm],
+    next_cursor: str | None,
+    fields: frozenset[str] | None = None,
+) -> bytes:
+    """Serialize page of photos as PhotoDto JSON list, or its `fields`, and cache it."""
+    adapter = photo_fields_adapter(fields) if fields else photos_adapter
+    payload = adapter.dump_json(adapter.validate_python(photos))
+    # cursor is url-safe base64, so a newline reliably separates it from JSON
+    value = (next_cursor or "").encode() + b"\n" + payload
+    await cache_backend.set(key, value, ttl=settings.cache.ttl)
+    return payload
+
+
+async def invalidate(owner_id: int, photo_uuid: UUID | None = None) -> None:
+    """Drop cached photo and every cached listing page of its owner."""
+    if photo_uuid is not None:
+        await cache_backend.delete(_photo_key(owner_id, photo_uuid))
+    await _bump_version(owner_id)
@@ -1,13 +1,76 @@
+import asyncio
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
+from argon2.profiles import RFC_9106_LOW_MEMORY
 from pwdlib import PasswordHash
 
+from src.core import settings
+
+# memory used by a single Argon2 hash with the parameters of `recommended()`
+ARGON2_MEMORY_COST_MB = RFC_9106_LOW_MEMORY.memory_cost // 1024
+
 
 class PasswordHashService:
-    """Service for hashing and verifying passwords."""
+    """Service for hashing and verifying passwords.
+
+    Argon2 is CPU- and memory-heavy by design, so the async methods run it in
+    a shared process pool instead of blocking the event loop. Concurrency is
+    capped both by the pool size and by `memory_budget_mb`.
+    """
 
     _password_hash = PasswordHash.recommended()
+    _executor: ProcessPoolExecutor | None = None
+    _concurrency = 1
+    # asyncio primitives are bound to the loop they are first used in
+    _semaphores: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, asyncio.Semaphore
+    ] = weakref.WeakKeyDictionary()
 
     def hash(self, password: str) -> str:
         return self._password_hash.hash(password=password)
 
     def verify(self, password: str, hashed_password: str) -> bool:
         return self._password_hash.verify(password=password, hash=hashed_password)
+
+    async def hash_async(self, password: str) -> str:
+        return await self._run(self._password_hash.hash, password)
+
+    async def verify_async(self, password: str, hashed_password: str) -> bool:
+        return await self._run(self._password_hash.verify, password, hashed_password)
+
+    @classmethod
+    async def _run(cls, func: Callable[..., Any], *args: Any) -> Any:
+        """Run hasher method in the process pool, or inline if the pool is off."""
+        if not settings.password_hash.use_process_pool:
+            return func(*args)
+
+        if cls._executor is None:
+            cls._start_pool()
+
+        loop = asyncio.get_running_loop()
+        if (semaphore := cls._semaphores.get(loop)) is None:
+            semaphore = cls._semaphores[loop] = asyncio.Semaphore(cls._concurrency)
+
+        async with semaphore:
+            return await loop.run_in_executor(cls._executor, func, *args)
+
+    @classmethod
+    def _start_pool(cls) -> None:
+        config = settings.password_hash
+        workers = config.pool_size or os.cpu_count() or 1
+        by_memory = max(1, config.memory_budget_mb // ARGON2_MEMORY_COST_MB)
+
+        cls._executor = ProcessPoolExecutor(max_workers=workers)
+        cls._concurrency = min(workers, by_memory)
+        cls._semaphores.clear()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Stop worker processes of the pool, if it was started."""
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
+            cls._semaphores.clear()
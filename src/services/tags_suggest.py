@@ -0,0 +1,90 @@
+import asyncio
+import heapq
+import sys
+import time
+from bisect import bisect_left
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core import db_helper, settings
+from src.repository import tags_crud
+
+
+class TagPrefixIndex:
+    """Immutable sorted array of tags answering prefix lookups by bisection."""
+
+    def __init__(self, usage: list[tuple[str, int]]) -> None:
+        self._entries = sorted((name.casefold(), name, count) for name, count in usage)
+        self._keys = [key for key, _, _ in self._entries]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def suggest(self, prefix: str, limit: int) -> list[tuple[str, int]]:
+        """Return up to `limit` most used tags starting with `prefix`, ignoring case."""
+        prefix = prefix.casefold()
+        start = bisect_left(self._keys, prefix)
+        end = bisect_left(self._keys, prefix + chr(sys.maxunicode), lo=start)
+
+        matches = heapq.nsmallest(
+            limit,
+            (self._entries[i] for i in range(start, end)),
+            key=lambda entry: (-entry[2], entry[1]),
+        )
+        return [(name, count) for _, name, count in matches]
+
+
+_index: TagPrefixIndex | None = None
+_loaded_at = float("-inf")
+_refresh_task: asyncio.Task | None = None
+
+
+async def refresh(session: AsyncSession) -> None:
+    """Rebuild the index, or drop it if there are too many tags to hold in memory.
+
+    Past `max_indexed_tags` only an `EXISTS` probe runs, no tags are loaded.
+    """
+    global _index, _loaded_at
+
+    max_tags = settings.tag_suggest.max_indexed_tags
+    if await tags_crud.has_more_tags_than(session=session, count=max_tags):
+        _index = None
+    else:
+        usage = await tags_crud.get_tags_usage(session=session, limit=max_tags)
+        _index = TagPrefixIndex(usage)
+    _loaded_at = time.monotonic()
+
+
+async def _refresh_in_background() -> None:
+    async with db_helper.session_factory() as session:
+        await refresh(session)
+
+
+def _on_refreshed(task: asyncio.Task) -> None:
+    # a failed refresh leaves the index stale, the next request starts another
+    if not task.cancelled():
+        task.exception()
+
+
+async def suggest(
+    session: AsyncSession,
+    prefix: str,
+    limit: int = 10,
+) -> list[tuple[str, int]]:
+    """Return most used tags starting with `prefix`.
+
+    Served from the in-memory index rebuilt every `refresh_interval` seconds.
+    A stale index is rebuilt by a single background task, requests keep using
+    the previous one meanwhile. Falls back to the trigram-indexed query when
+    the index is not available.
+    """
+    global _refresh_task
+
+    stale = time.monotonic() - _loaded_at >= settings.tag_suggest.refresh_interval
+    if stale and (_refresh_task is None or _refresh_task.done()):
+        _refresh_task = asyncio.create_task(_refresh_in_background())
+        _refresh_task.add_done_callback(_on_refreshed)
+
+    if _index is None:
+        return await tags_crud.suggest_tags(session=session, prefix=prefix, limit=limit)
+    return _index.suggest(prefix, limit)
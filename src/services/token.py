@@ -1,27 +1,38 @@
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import jwt
 from fastapi import HTTPException, status
 from jwt import InvalidTokenError
+from pydantic import ValidationError
 
 from src.constants import ACCESS_TOKEN_TYPE, REFRESH_TOKEN_TYPE, TOKEN_TYPE_FIELD
-from src.core import settings
+from src.core import TTLCache, settings
 from src.core.models import UserOrm
-from src.schemas import TokenData
+from src.schemas import CurrentUser, TokenData
 
 
 class TokenService:
-    def create_access_token(self, user: UserOrm) -> str:
+    # sha256 of token -> (token type, validated data), kept until token expiration
+    _decoded_cache: TTLCache[bytes, tuple[str, TokenData]] = TTLCache(
+        maxsize=settings.jwt.decode_cache_size,
+        ttl=settings.jwt.access_token_expire_minutes * 60,
+        name="jwt_decode_cache",
+    )
+
+    def create_access_token(self, user: UserOrm | CurrentUser) -> str:
         """Create access token based on user data."""
         payload = {
             "sub": user.email,
             "user_id": user.id,
             "role": user.role,
+            "is_active": user.is_active,
         }
         return self._create_jwt(ACCESS_TOKEN_TYPE, payload)
 
-    def create_refresh_token(self, user: UserOrm) -> str:
+    def create_refresh_token(self, user: UserOrm | CurrentUser) -> str:
         """Create refresh token based on user data."""
         payload = {
             "sub": user.email,
@@ -31,21 +42,32 @@ class TokenService:
         return self._create_jwt(REFRESH_TOKEN_TYPE, payload, expire_delta)
 
     def decode_token(self, token: str, token_type: str) -> TokenData:
-        """Decode token and return payload."""
-        try:
-            payload = self._decode_jwt(token)
-            if payload[TOKEN_TYPE_FIELD] != token_type:
+        """Decode token and return payload.
+
+        Successfully validated tokens are cached until they expire, so a
+        client presenting the same token again skips signature verification.
+        """
+        key = hashlib.sha256(token.encode()).digest()
+        if (cached := self._decoded_cache.get(key)) is None:
+            try:
+                payload = self._decode_jwt(token)
+                cached = (payload[TOKEN_TYPE_FIELD], TokenData(**payload))
+                ttl = payload["exp"] - time.time()
+            except (InvalidTokenError, KeyError, ValidationError):
+                # signed by us but missing claims counts as a bad token as well
                 raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="Invalid token type",
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Could not validate credentials",
                 )
-            return TokenData(**payload)
+            self._decoded_cache.set(key, cached, ttl=ttl)
 
-        except InvalidTokenError:
+        cached_token_type, token_data = cached
+        if cached_token_type != token_type:
             raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials",
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Invalid token type",
             )
+        return token_data
 
     def _create_jwt(
         self,
@@ -69,7 +91,9 @@ class TokenService:
             expire = now + expire_delta
         else:
             expire = now + timedelta(minutes=settings.jwt.access_token_expire_minutes)
-        to_encode.update({"exp": expire, "iat": now})
+        # sub-second `iat` tells tokens issued right after a revocation from
+        # those issued right before it, see `auth_service.invalidate_user`
+        to_encode.update({"exp": expire, "iat": now.timestamp()})
 
         return jwt.encode(
             to_encode,
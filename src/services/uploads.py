@@ -0,0 +1,155 @@
+from typing import AsyncIterator
+
+from fastapi import HTTPException, Request, status
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import (
+    MultipartParser,
+    MultipartState,
+    parse_options_header,
+)
+
+
+class MultipartFileStream:
+    """Incremental multipart/form-data reader that streams a single file field.
+
+    File data is yielded by `chunks()` as soon as it is read from the socket,
+    regular form fields are collected into `fields`. Fields sent after the
+    file are available only once `chunks()` is exhausted.
+    """
+
+    max_field_size = 64 * 1024
+
+    def __init__(self, request: Request, file_field: str, max_size: int) -> None:
+        self.request = request
+        self.file_field = file_field
+        self.max_size = max_size
+        self.fields: dict[str, str] = {}
+        self.filename: str | None = None
+        self.size = 0
+
+        self._pending: list[bytes] = []
+        self._header_name = b""
+        self._header_value = b""
+        self._disposition = b""
+        self._part_name = ""
+        self._part_is_file = False
+        self._part_data = bytearray()
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        """Yield file data chunks, reading the whole request body."""
+        parser = self._create_parser()
+
+        async for data in self.request.stream():
+            try:
+                parser.write(data)
+            except MultipartParseError:
+                raise self._malformed()
+            for chunk in self._pending:
+                yield chunk
+            self._pending.clear()
+
+        parser.finalize()
+        # a truncated body is not an error for the parser, it just never ends
+        if parser.state != MultipartState.END:
+            raise self._malformed()
+        if not self.size:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Field '{self.file_field}' must contain a non-empty file",
+            )
+
+    def _create_parser(self) -> MultipartParser:
+        """Validate request headers and create a callback-driven parser."""
+        if (content_length := self.request.headers.get("content-length")) is not None:
+            try:
+                length = int(content_length)
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid Content-Length header",
+                )
+            if length > self.max_size + self.max_field_size:
+                raise self._too_large()
+
+        content_type, params = parse_options_header(
+            self.request.headers.get("content-type", "")
+        )
+        if content_type != b"multipart/form-data" or b"boundary" not in params:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="Expected multipart/form-data request",
+            )
+
+        callbacks = {
+            "on_part_begin": self._on_part_begin,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+        }
+        return MultipartParser(params[b"boundary"], callbacks)
+
+    def _too_large(self) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"File exceeds maximum size of {self.max_size} bytes",
+        )
+
+    def _malformed(self) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Malformed multipart body",
+        )
+
+    def _on_part_begin(self) -> None:
+        self._disposition = b""
+        self._part_name = ""
+        self._part_is_file = False
+        self._part_data = bytearray()
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._part_is_file:
+            self.size += end - start
+            if self.size > self.max_size:
+                raise self._too_large()
+            self._pending.append(data[start:end])
+            return
+
+        self._part_data += data[start:end]
+        if len(self._part_data) > self.max_field_size:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Field '{self._part_name}' is too large",
+            )
+
+    def _on_part_end(self) -> None:
+        if not self._part_is_file and self._part_name != self.file_field:
+            self.fields[self._part_name] = self._part_data.decode(errors="replace")
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        if self._header_name.lower() == b"content-disposition":
+            self._disposition = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._disposition)
+        self._part_name = options.get(b"name", b"").decode(errors="replace")
+        if self._part_name != self.file_field or b"filename" not in options:
+            return
+
+        if self.filename is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Only one file is accepted in field '{self.file_field}'",
+            )
+        self.filename = options[b"filename"].decode(errors="replace")
+        self._part_is_file = True
@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.constants import NEXT_CURSOR_HEADER
+from src.core.models import UserOrm
+from src.schemas import UserRoles
+from src.services import TokenService
+
+
+@pytest.fixture
+def admin_headers(session_factory: async_sessionmaker) -> dict[str, str]:
+    async def create() -> UserOrm:
+        async with session_factory() as session:
+            admin = UserOrm(
+                email="admin@example.com",
+                hashed_password="!",
+                role=UserRoles.ADMIN,
+                is_active=True,
+            )
+            session.add(admin)
+            await session.commit()
+            return admin
+
+    admin = asyncio.run(create())
+    return {"Authorization": f"Bearer {TokenService().create_access_token(admin)}"}
+
+
+@pytest.mark.parametrize("fields", [None, "uuid,description"])
+def test_user_photos_page(client, admin_headers, user, photos, fields):
+    params = {"limit": 2} | ({"fields": fields} if fields else {})
+
+    response = client.get(
+        f"/api/admin/photos/user/{user.id}", params=params, headers=admin_headers
+    )
+
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    assert response.headers[NEXT_CURSOR_HEADER]
+    if fields:
+        assert all(p.keys() == {"uuid", "description"} for p in response.json())
@@ -0,0 +1,123 @@
+import time
+
+import jwt
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.constants import ACCESS_TOKEN_TYPE, TOKEN_TYPE_FIELD
+from src.core import settings
+from src.schemas import CurrentUser, UserRoles
+from src.services import TokenService, auth_service
+
+principal = auth_service.get_token_principal(from_token_type=ACCESS_TOKEN_TYPE)
+
+
+def make_user(**overrides) -> CurrentUser:
+    attrs = {
+        "id": 999,
+        "email": "ghost@example.com",
+        "role": UserRoles.USER,
+        "is_active": True,
+    }
+    return CurrentUser(**attrs | overrides)
+
+
+def bearer(user: CurrentUser) -> HTTPAuthorizationCredentials:
+    token = TokenService().create_access_token(user)
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+@pytest.fixture
+def shared_cache(monkeypatch, redis_backend):
+    monkeypatch.setattr(auth_service, "cache_backend", redis_backend)
+    return redis_backend
+
+
+async def test_principal_from_claims():
+    user = make_user()
+
+    assert await principal(bearer(user), TokenService()) == user
+
+
+async def test_principal_rejects_token_issued_before_revocation(shared_cache):
+    credentials = bearer(make_user())
+
+    await auth_service.invalidate_user(999)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await principal(credentials, TokenService())
+    assert exc_info.value.status_code == 401
+
+
+async def test_principal_accepts_token_issued_after_revocation(shared_cache):
+    await auth_service.invalidate_user(999)
+
+    # typically within the same second, e.g. the token refreshed after logout
+    credentials = bearer(make_user())
+
+    assert await principal(credentials, TokenService()) == make_user()
+
+
+async def test_revocation_by_other_worker(shared_cache):
+    credentials = bearer(make_user())
+    assert await principal(credentials, TokenService()) == make_user()
+
+    # another worker revokes the user, the local lookup expires
+    await shared_cache.set("user:revoked:999", repr(time.time()).encode(), ttl=60)
+    auth_service.revocations_cache.clear()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await principal(credentials, TokenService())
+    assert exc_info.value.status_code == 401
+
+
+async def test_revocation_lookups_are_cached(shared_cache, monkeypatch):
+    lookups = []
+    get = shared_cache.get
+
+    async def counting_get(key):
+        lookups.append(key)
+        return await get(key)
+
+    monkeypatch.setattr(shared_cache, "get", counting_get)
+    credentials = bearer(make_user())
+
+    for _ in range(3):
+        await principal(credentials, TokenService())
+
+    assert lookups == ["user:revoked:999"]
+
+
+@pytest.mark.parametrize("claim", [TOKEN_TYPE_FIELD, "exp", "user_id"])
+def test_decode_rejects_token_missing_claim(claim):
+    claims = {
+        TOKEN_TYPE_FIELD: ACCESS_TOKEN_TYPE,
+        "exp": time.time() + 60,
+        "user_id": 1,
+    }
+    del claims[claim]
+    token = jwt.encode(
+        claims, key=settings.jwt.secret, algorithm=settings.jwt.algorithm
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        TokenService().decode_token(token, ACCESS_TOKEN_TYPE)
+    assert exc_info.value.status_code == 401
+
+
+async def test_principal_rejects_inactive_user():
+    credentials = bearer(make_user(is_active=False))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await principal(credentials, TokenService())
+    assert exc_info.value.status_code == 403
+
+
+def test_me_of_deleted_user(client):
+    credentials = bearer(make_user())
+    headers = {"Authorization": f"Bearer {credentials.credentials}"}
+
+    response = client.get("/api/users/me", headers=headers)
+
+    assert response.status_code == 401
@@ -0,0 +1,24 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.core import cloudinary_cli
+
+
+def test_busy_storage_answers_503(client, auth_headers, photos, monkeypatch):
+    monkeypatch.setattr(cloudinary_cli, "max_pending", 0)
+
+    response = client.delete(f"/api/photos/{photos[0].uuid}", headers=auth_headers)
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+async def test_rejected_submit_frees_slot(monkeypatch):
+    executor = ThreadPoolExecutor(max_workers=1)
+    executor.shutdown()
+    monkeypatch.setattr(cloudinary_cli, "_executor", executor)
+
+    with pytest.raises(RuntimeError):
+        await cloudinary_cli._run(int)
+    assert cloudinary_cli.saturation == 0
@@ -0,0 +1,31 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+
+def test_photo_revalidated_by_etag(client, auth_headers, photos):
+    url = f"/api/photos/{photos[0].uuid}"
+    response = client.get(url, headers=auth_headers)
+    etag = response.headers["ETag"]
+
+    response = client.get(url, headers=auth_headers | {"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+
+def test_photo_ignores_if_modified_since(client, auth_headers, photos):
+    url = f"/api/photos/{photos[0].uuid}"
+    response = client.get(url, headers=auth_headers)
+    assert "Last-Modified" not in response.headers
+
+    # a new comment does not move the photo `updated_at`
+    client.post(
+        f"/api/comments/photo/{photos[0].uuid}",
+        json={"text": "nice"},
+        headers=auth_headers,
+    )
+    since = format_datetime(datetime.now(timezone.utc) + timedelta(days=1), usegmt=True)
+    response = client.get(url, headers=auth_headers | {"If-Modified-Since": since})
+
+    assert response.status_code == 200
+    assert response.json()["comments_count"] == 1
@@ -0,0 +1,86 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from src.services import photos_cache
+
+OWNER_ID = 1
+
+
+def make_photo(**overrides) -> SimpleNamespace:
+    now = datetime.now(timezone.utc)
+    attrs = {
+        "uuid": uuid4(),
+        "owner_id": OWNER_ID,
+        "cloudinary_url": "https://example.com/photo.jpg",
+        "description": None,
+        "created_at": now,
+        "updated_at": now,
+        "comments_count": 0,
+        "tags": [],
+        "transformations": [],
+    }
+    return SimpleNamespace(**attrs | overrides)
+
+
+@pytest.fixture(autouse=True)
+def shared_cache(monkeypatch, redis_backend):
+    monkeypatch.setattr(photos_cache, "cache_backend", redis_backend)
+
+
+async def test_page_miss_then_hit():
+    key = await photos_cache.page_key(OWNER_ID, offset=0, limit=10, cursor=None)
+    assert await photos_cache.get_page(key) is None
+
+    payload = await photos_cache.set_page(key, [make_photo()], next_cursor="next")
+
+    assert await photos_cache.get_page(key) == (payload, "next")
+
+
+async def test_page_without_next_cursor():
+    key = await photos_cache.page_key(OWNER_ID, offset=0, limit=10, cursor=None)
+    payload = await photos_cache.set_page(key, [], next_cursor=None)
+
+    assert await photos_cache.get_page(key) == (payload, None)
+
+
+async def test_invalidate_drops_pages_and_photo():
+    photo = make_photo()
+    key = await photos_cache.page_key(OWNER_ID, offset=0, limit=10, cursor=None)
+    await photos_cache.set_page(key, [photo], next_cursor=None)
+    await photos_cache.set_photo(photo, etag='"v1"')
+
+    await photos_cache.invalidate(owner_id=OWNER_ID, photo_uuid=photo.uuid)
+
+    key = await photos_cache.page_key(OWNER_ID, offset=0, limit=10, cursor=None)
+    assert await photos_cache.get_page(key) is None
+    assert await photos_cache.get_photo(OWNER_ID, photo.uuid, etag='"v1"') is None
+
+
+async def test_page_stored_after_invalidation_is_not_served():
+    # the page is read before an invalidation and stored after it
+    key = await photos_cache.page_key(OWNER_ID, offset=0, limit=10, cursor=None)
+    await photos_cache.invalidate(owner_id=OWNER_ID)
+    await photos_cache.set_page(key, [make_photo()], next_cursor=None)
+
+    key = await photos_cache.page_key(OWNER_ID, offset=0, limit=10, cursor=None)
+    assert await photos_cache.get_page(key) is None
+
+
+async def test_invalidate_keeps_pages_of_other_owners():
+    key = await photos_cache.page_key(2, offset=0, limit=10, cursor=None)
+    payload = await photos_cache.set_page(key, [make_photo(owner_id=2)], None)
+
+    await photos_cache.invalidate(owner_id=OWNER_ID)
+
+    assert await photos_cache.get_page(key) == (payload, None)
+
+
+async def test_photo_hit_requires_matching_version():
+    photo = make_photo()
+    payload = await photos_cache.set_photo(photo, etag='"v1"')
+
+    assert await photos_cache.get_photo(OWNER_ID, photo.uuid, etag='"v1"') == payload
+    assert await photos_cache.get_photo(OWNER_ID, photo.uuid, etag='"v2"') is None
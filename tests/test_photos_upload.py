@@ -0,0 +1,63 @@
+import pytest
+
+from src.core import cloudinary_cli, settings
+from src.schemas import UploadImageResult
+
+
+@pytest.fixture
+def uploaded(monkeypatch) -> list[bytes]:
+    """Contents of files sent to the fake image storage."""
+    contents: list[bytes] = []
+
+    async def upload_image(photo_uuid, file, user_id):
+        data = file.read()
+        if data == b"broken":
+            raise OSError("connection reset")
+        contents.append(data)
+        return UploadImageResult(
+            public_id=str(photo_uuid),
+            width=1,
+            height=1,
+            format="jpg",
+            resource_type="image",
+            secure_url=f"https://example.com/{photo_uuid}.jpg",
+            asset_folder="photos",
+        )
+
+    monkeypatch.setattr(cloudinary_cli, "upload_image", upload_image)
+    return contents
+
+
+def test_batch_reports_failed_item(client, auth_headers, uploaded):
+    files = [
+        ("files", ("ok.jpg", b"image", "image/jpeg")),
+        ("files", ("broken.jpg", b"broken", "image/jpeg")),
+    ]
+
+    response = client.post(
+        "/api/photos/upload/batch", files=files, headers=auth_headers
+    )
+
+    assert response.status_code == 207
+    ok, broken = response.json()
+    assert ok["photo"] is not None and ok["error"] is None
+    assert broken["photo"] is None and broken["error"] == "Upload failed"
+
+
+def test_batch_rejects_oversized_item(client, auth_headers, uploaded, monkeypatch):
+    monkeypatch.setattr(settings.cloudinary, "max_upload_size", 8)
+    files = [
+        ("files", ("ok.jpg", b"image", "image/jpeg")),
+        ("files", ("huge.jpg", b"x" * 9, "image/jpeg")),
+    ]
+
+    response = client.post(
+        "/api/photos/upload/batch", files=files, headers=auth_headers
+    )
+
+    assert response.status_code == 207
+    ok, huge = response.json()
+    assert ok["photo"] is not None
+    assert huge["photo"] is None
+    assert huge["error"] == "File exceeds maximum size of 8 bytes"
+    assert uploaded == [b"image"]
@@ -0,0 +1,63 @@
+def test_list_photos(client, auth_headers, photos, max_queries):
+    # photos, then their tags and transformations
+    with max_queries(3):
+        response = client.get("/api/photos", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert len(response.json()) == len(photos)
+
+
+def test_list_photos_with_comments(client, auth_headers, comment, max_queries):
+    # photos, their tags and transformations, then the newest comments
+    with max_queries(4):
+        response = client.get(
+            "/api/photos", params={"include": "comments:3"}, headers=auth_headers
+        )
+
+    assert response.status_code == 200
+    latest = {p["uuid"]: p["latest_comments"] for p in response.json()}
+    [preview] = latest[str(comment.photo_uuid)]
+    assert preview["text"] == "hi"
+    assert preview["user_email"]
+
+
+def test_list_photos_from_cache(client, auth_headers, photos, max_queries):
+    client.get("/api/photos", headers=auth_headers)
+
+    with max_queries(0):
+        response = client.get("/api/photos", headers=auth_headers)
+
+    assert response.status_code == 200
+
+
+def test_get_photo(client, auth_headers, photos, max_queries):
+    # version, then the photo with its tags and transformations
+    with max_queries(4):
+        response = client.get(f"/api/photos/{photos[0].uuid}", headers=auth_headers)
+
+    assert response.status_code == 200
+
+
+def test_create_comment(client, auth_headers, photos, max_queries):
+    # user, photo comment count, then the comment itself
+    with max_queries(3):
+        response = client.post(
+            f"/api/comments/photo/{photos[0].uuid}",
+            json={"text": "nice"},
+            headers=auth_headers,
+        )
+
+    assert response.status_code == 201
+
+
+def test_update_comment(client, auth_headers, comment, max_queries):
+    # user, comment, then a single update returning its timestamp
+    with max_queries(3):
+        response = client.put(
+            f"/api/comments/comment/{comment.uuid}",
+            json={"text": "edited"},
+            headers=auth_headers,
+        )
+
+    assert response.status_code == 200
+    assert response.json()["text"] == "edited"
@@ -0,0 +1,86 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event, text
+
+from src.repository import comments_crud, photos_crud
+
+
+@contextmanager
+def recorded_statements(engine):
+    """Collect SQL and parameters of statements executed within the block.
+
+    Recorded at the cursor level, so relationship loads are included.
+    """
+    statements: list[tuple[str, tuple]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+def find_statement(statements: list[tuple[str, tuple]], table: str):
+    return next(s for s in statements if f"FROM {table}" in s[0])
+
+
+async def explain(session, statement: str, parameters: tuple) -> str:
+    # a handful of test rows would be read sequentially or through a bitmap and
+    # then sorted, ask what the index serves
+    await session.execute(text("SET LOCAL enable_seqscan = off"))
+    await session.execute(text("SET LOCAL enable_bitmapscan = off"))
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+    return "\n".join(result.scalars())
+
+
+@pytest.mark.parametrize(
+    ("load", "table", "index"),
+    [
+        (
+            lambda session, user, photos: photos_crud.get_photos(
+                session=session, owner_id=user.id
+            ),
+            "photos",
+            "ix_photos_owner_id_created_at_uuid",
+        ),
+        (
+            lambda session, user, photos: comments_crud.get_comments_by_photo(
+                session=session, photo_uuid=photos[0].uuid
+            ),
+            "comments",
+            "ix_comments_photo_uuid_created_at_uuid",
+        ),
+        (
+            lambda session, user, photos: comments_crud.get_comments(
+                session=session, user_id=user.id
+            ),
+            "comments",
+            "ix_comments_user_id_created_at_uuid",
+        ),
+        (
+            lambda session, user, photos: photos_crud.get_photo_by_uuid(
+                session=session, photo_uuid=photos[0].uuid
+            ),
+            "photo_transformed",
+            "ix_photo_transformed_original_uuid_created_at_uuid",
+        ),
+    ],
+    ids=["photos_by_owner", "comments_by_photo", "comments_by_user", "transformations"],
+)
+async def test_listing_uses_index(
+    engine, session_factory, user, photos, comment, load, table, index
+):
+    async with session_factory() as session:
+        with recorded_statements(engine) as statements:
+            await load(session, user, photos)
+
+        plan = await explain(session, *find_statement(statements, table))
+
+    assert index in plan
+    # rows come out of the index already ordered
+    assert "Sort" not in plan
@@ -0,0 +1,19 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core import settings
+from src.services import PasswordHashService
+
+
+def test_pool_serves_several_event_loops(monkeypatch):
+    monkeypatch.setattr(settings.password_hash, "use_process_pool", True)
+    monkeypatch.setattr(PasswordHashService, "_executor", ThreadPoolExecutor(1))
+    monkeypatch.setattr(PasswordHashService, "_concurrency", 1)
+
+    async def run_concurrently() -> list[str]:
+        # the second call waits on the semaphore, binding it to this loop
+        return await asyncio.gather(*(PasswordHashService._run(str, i) for i in (1, 2)))
+
+    assert asyncio.run(run_concurrently()) == ["1", "2"]
+    assert asyncio.run(run_concurrently()) == ["1", "2"]
+    PasswordHashService.shutdown()
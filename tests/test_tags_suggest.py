@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from src.core import settings
+from src.repository import tags_crud
+from src.services import tags_suggest
+
+
+@pytest.fixture(autouse=True)
+def fresh_index(monkeypatch):
+    monkeypatch.setattr(tags_suggest, "_index", None)
+    monkeypatch.setattr(tags_suggest, "_loaded_at", float("-inf"))
+    monkeypatch.setattr(tags_suggest, "_refresh_task", None)
+
+
+async def test_refresh_builds_index(session_factory, photos, monkeypatch):
+    monkeypatch.setattr(settings.tag_suggest, "max_indexed_tags", 2)
+
+    async with session_factory() as session:
+        await tags_suggest.refresh(session)
+
+    assert len(tags_suggest._index) == 2
+    assert tags_suggest._index.suggest("C", limit=10) == [("cat", 3)]
+
+
+async def test_refresh_does_not_load_too_many_tags(
+    session_factory, photos, monkeypatch
+):
+    async def get_tags_usage(*args, **kwargs):
+        raise AssertionError("tags must not be loaded")
+
+    monkeypatch.setattr(settings.tag_suggest, "max_indexed_tags", 1)
+    monkeypatch.setattr(tags_crud, "get_tags_usage", get_tags_usage)
+
+    async with session_factory() as session:
+        await tags_suggest.refresh(session)
+
+    assert tags_suggest._index is None
+
+
+async def test_suggest_does_not_wait_for_refresh(session_factory, photos, monkeypatch):
+    refreshed = asyncio.Event()
+    monkeypatch.setattr(tags_suggest, "_refresh_in_background", refreshed.wait)
+
+    async with session_factory() as session:
+        suggestions = await tags_suggest.suggest(session, prefix="d")
+        # a request arriving while the index is rebuilt starts no other refresh
+        task = tags_suggest._refresh_task
+        await tags_suggest.suggest(session, prefix="d")
+
+    assert suggestions == [("dog", 3)]
+    assert tags_suggest._refresh_task is task
+    assert not task.done()
+    refreshed.set()
+    await task
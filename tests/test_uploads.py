@@ -0,0 +1,103 @@
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from src.core import cloudinary_cli
+from src.services import MultipartFileStream
+
+FILE_PART = (
+    b"--x\r\n"
+    b'Content-Disposition: form-data; name="file"; filename="a.jpg"\r\n'
+    b"Content-Type: image/jpeg\r\n\r\n"
+    b"image"
+)
+
+
+def make_stream(
+    headers: dict[str, str],
+    body: bytes = b"",
+    max_size: int = 1024,
+) -> MultipartFileStream:
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return MultipartFileStream(
+        Request(scope, receive), file_field="file", max_size=max_size
+    )
+
+
+async def read(stream: MultipartFileStream) -> bytes:
+    return b"".join([chunk async for chunk in stream.chunks()])
+
+
+@pytest.mark.parametrize(
+    ("content_length", "status_code"),
+    [("abc", 400), ("-", 400), (str(1024 * 1024), 413)],
+)
+async def test_rejects_content_length(content_length, status_code):
+    stream = make_stream(
+        {
+            "Content-Length": content_length,
+            "Content-Type": "multipart/form-data; boundary=x",
+        }
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await read(stream)
+    assert exc_info.value.status_code == status_code
+
+
+async def test_reads_file():
+    body = FILE_PART + b"\r\n--x--\r\n"
+    stream = make_stream({"Content-Type": "multipart/form-data; boundary=x"}, body)
+
+    assert await read(stream) == b"image"
+    assert stream.filename == "a.jpg"
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b"garbage", FILE_PART],
+    ids=["malformed", "truncated"],
+)
+async def test_rejects_broken_body(body):
+    stream = make_stream({"Content-Type": "multipart/form-data; boundary=x"}, body)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await read(stream)
+    assert exc_info.value.status_code == 400
+
+
+async def test_stream_failure_destroys_sent_parts(monkeypatch):
+    sent: list[bytes] = []
+    destroyed = []
+
+    async def upload_part(upload_id, part, offset, total, options):
+        sent.append(part)
+        return {}
+
+    async def destroy_image(photo_uuid):
+        destroyed.append(photo_uuid)
+
+    async def chunks():
+        yield b"x" * (cloudinary_cli.upload_chunk_size + 1)
+        raise HTTPException(status_code=413)
+
+    monkeypatch.setattr(cloudinary_cli, "_upload_part", upload_part)
+    monkeypatch.setattr(cloudinary_cli, "destroy_image", destroy_image)
+    photo_uuid = uuid4()
+
+    with pytest.raises(HTTPException):
+        await cloudinary_cli.upload_image_stream(photo_uuid, chunks(), user_id=1)
+
+    assert len(sent) == 1
+    assert destroyed == [photo_uuid]